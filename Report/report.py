@@ -1,9 +1,23 @@
 """Report class
 """
-from typing import List
+from itertools import chain
+from pathlib import Path
+from typing import Any, Iterable, List
+import csv
 import json
-from openpyxl.styles import Font, PatternFill
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, NamedStyle, PatternFill
 from openpyxl import Workbook
+from openpyxl.formatting.rule import FormulaRule
+from openpyxl.utils import get_column_letter
+
+SETTINGS = Path(__file__).resolve().parent / "settings.json"
+# Colour names usable in Report/settings.json; anything else is used as (a)RGB hex
+COLORS = {
+    "red": "FFFFC7CE",
+    "green": "FFC6EFCE",
+    "yellow": "FFFFEB9C",
+}
 
 
 class Report():
@@ -19,7 +33,7 @@ class Report():
         self.config = {
             "bold": Font(bold=True)
         }
-        with open("Report/settings.json", "r", encoding="utf-8") as f:
+        with open(SETTINGS, "r", encoding="utf-8") as f:
             self.settings = json.load(f)
 
     def __parse_number(self, number: str) -> int | float | str:
@@ -56,58 +70,91 @@ class Report():
         """
         self.data = data
 
-    def save(self, fname: str):
-        """Save spreadsheet
+    @staticmethod
+    def _fill(color: str) -> PatternFill:
+        """internal: Solid fill of colour
 
         Args:
-            fname (str): Filename of spreadsheet
+            color (str): Colour name (see COLORS) or (a)RGB hex
 
-        Raises:
-            Exception: Too many header values; may be fixed in future
+        Returns:
+            PatternFill: Fill
         """
-        self.workbook = Workbook()
-        sheet = self.workbook.active
-        pos = 1
-        try:
-            head = [f"{c}{pos}" for c in self.alphabet[:len(self.headers)]]
-        except Exception as exception:
-            # TODO: Fix issue with spreadsheet coordinates
-            raise exception from Exception("Too many header values")
-        for cell, val in zip(head, self.headers):
-            sheet[cell] = val
-            sheet[cell].font = self.config["bold"]
-            # TODO: Find out how to freeze y-axis, not x-axis
-            # sheet.freeze_panes = cell
-
-        # Fix for above TODO
-        cell = sheet['B2']
-        sheet.freeze_panes = cell
-
-        for row in self.data:
-            print(row)
-            pos += 1
-            first = True
-            head = [f"{c}{pos}" for c in self.alphabet[:len(self.headers)]]
-            for i, cell, val in zip(range(len(row)), head, row):
-                sheet[cell] = val
-                if first:
-                    sheet[cell].font = self.config["bold"]
-                    first = False
-                else:
-                    if val < self.settings[self.headers[i]]["threshold"]:
-                        color = self.settings[self.headers[i]]["lower"]
-                        sheet[cell].fill = PatternFill(
-                            start_color=color, end_color=color, fill_type="solid")
-                    else:
-                        color = self.settings[self.headers[i]]["higher"]
-                        sheet[cell].fill = PatternFill(
-                            start_color=color, end_color=color, fill_type="solid")
+        rgb = COLORS.get(color, color)
+        return PatternFill(start_color=rgb, end_color=rgb, fill_type="solid")
 
-        # Add filter to sort results
-        sheet.auto_filter.ref = sheet.dimensions
+    def _add_rules(self, sheet: Any, headers: List[str], rows: int):
+        """internal: Colour every column with a threshold in settings.json by
+        conditional formatting; numbers below the threshold get the "lower",
+        all others the "higher" colour, text and empty cells stay uncoloured
 
+        Args:
+            sheet (Any): Worksheet
+            headers (List[str]): Column headers
+            rows (int): Number of data rows
+        """
+        if not rows:
+            return
+        for i, header in enumerate(headers):
+            conf = self.settings.get(header)
+            if i == 0 or not isinstance(conf, dict) or "threshold" not in conf:
+                continue
+            col = get_column_letter(i + 1)
+            ref = f"{col}2:{col}{rows + 1}"
+            first = f"{col}2"
+            threshold = conf["threshold"]
+            sheet.conditional_formatting.add(ref, FormulaRule(
+                formula=[f"AND(ISNUMBER({first}),{first}<{threshold})"],
+                fill=self._fill(conf["lower"]), stopIfTrue=True))
+            sheet.conditional_formatting.add(ref, FormulaRule(
+                formula=[f"AND(ISNUMBER({first}),{first}>={threshold})"],
+                fill=self._fill(conf["higher"]), stopIfTrue=True))
+
+    def write(self, fname: str, headers: List[str], rows: Iterable[list]):
+        """Stream rows into spreadsheet; rows are written as they arrive
+        (write-only workbook), so memory use does not grow with the number of rows.
+        Cells are coloured by conditional formatting (see _add_rules); thresholds
+        can be changed in the spreadsheet without generating it again
+
+        Args:
+            fname (str): Filename of spreadsheet
+            headers (List[str]): Column headers
+            rows (Iterable[list]): Values of each row; first column is the mail name
+        """
+        self.workbook = Workbook(write_only=True)
+        sheet = self.workbook.create_sheet()
+        # Keep header row and mail names visible
+        sheet.freeze_panes = "B2"
+        bold = "report_bold"
+        self.workbook.add_named_style(NamedStyle(name=bold, font=self.config["bold"]))
+
+        def styled(val: Any) -> WriteOnlyCell:
+            cell = WriteOnlyCell(sheet, value=val)
+            cell.style = bold
+            return cell
+
+        sheet.append([styled(val) for val in headers])
+        count = 0
+        for row in rows:
+            row = list(row)
+            if row:
+                row[0] = styled(row[0])
+            sheet.append(row)
+            count += 1
+
+        self._add_rules(sheet, headers, count)
+        # Add filter to sort results
+        sheet.auto_filter.ref = f"A1:{get_column_letter(max(len(headers), 1))}{count + 1}"
         self.workbook.save(fname)
 
+    def save(self, fname: str):
+        """Save spreadsheet
+
+        Args:
+            fname (str): Filename of spreadsheet
+        """
+        self.write(fname, self.headers, self.data)
+
     def as_csv(self, fname: str, sep: str = ","):
         """Save data as CSV
 
@@ -115,26 +162,47 @@ class Report():
             fname (str): Filename of CSV file
             sep (str, optional): Value separator. Defaults to ",".
         """
-        with open(fname, 'w', encoding="utf-8") as f:
-            f.write(sep.join(self.headers) + "\n")
-            for row in self.data:
-                f.write(','.join([str(val) for val in row]) + "\n")
+        with open(fname, 'w', encoding="utf-8", newline="") as f:
+            writer = csv.writer(f, delimiter=sep, lineterminator="\n")
+            writer.writerow(self.headers)
+            writer.writerows(self.data)
 
     def from_csv(self, fname: str, xlsx_file: str, sep: str = ","):
-        """Create report from CSV
+        """Create report from CSV; rows are streamed into the spreadsheet
+        and not kept in `data`
 
         Args:
             fname (str): Path to CSV file
             sep (str, optional): Value separator. Defaults to ",".
         """
         try:
-            with open(fname, 'r', encoding="utf-8") as f:
-                data = f.read().splitlines()
+            f = open(fname, 'r', encoding="utf-8", newline="")
+        except Exception as exception:
+            raise exception from FileNotFoundError(f"Could not open file '{fname}'")
+        with f:
+            reader = csv.reader(f, delimiter=sep)
+            headers = next(reader, [])
+            values = ([self.__parse_number(n) for n in row] for row in reader if row)
+            self.set_headers(headers)
+            self.write(xlsx_file, headers, values)
+
+    def from_jsonl(self, fname: str, xlsx_file: str):
+        """Create report from JSON Lines file; rows are streamed into the
+        spreadsheet and not kept in `data`
+
+        Args:
+            fname (str): Path to JSONL file; one object per row
+            xlsx_file (str): Filename of spreadsheet
+        """
+        try:
+            f = open(fname, 'r', encoding="utf-8")
         except Exception as exception:
             raise exception from FileNotFoundError(f"Could not open file '{fname}'")
-        headers = data[0].split(",")
-        values = [[self.__parse_number(n) for n in row.split(sep)]
-                  for row in data[1:]]
-        self.set_headers(headers)
-        self.set_data(values)
-        self.save(xlsx_file)
+        with f:
+            rows = (json.loads(line) for line in f if line.strip())
+            first = next(rows, None)
+            headers = list(first.keys()) if first else []
+            self.set_headers(headers)
+            values = ([row.get(key) for key in headers]
+                      for row in chain([first] if first else [], rows))
+            self.write(xlsx_file, headers, values)
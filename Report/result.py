@@ -24,6 +24,12 @@ class Result:
         """
         self.mail = fname
         self.data_ = {}
+        # Per check timings and cProfile stats; see profiler.py
+        self.timings = []
+        self.profile = None
+        # Weighted score and verdict (suspicious|benign|error); see scheduler.py
+        self.score = None
+        self.verdict = None
 
     def __getitem__(self, key):
         """_summary_
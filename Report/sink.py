@@ -0,0 +1,86 @@
+# Copyright 2022 Jakob Schaffarczyk
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Streaming result sink writing one row per analyzed mail
+"""
+from typing import List
+import csv
+import json
+from Report.result import Result
+
+# Columns read from attributes of Result instead of its check values
+ATTRIBUTES = ("score", "verdict")
+
+
+class ResultSink:
+    """Write results row by row to CSV or JSON Lines
+    """
+    formats = ["csv", "jsonl"]
+
+    def __init__(self, fname: str, headers: List[str], fmt: str = "csv",
+                 sep: str = ",", flush_every: int = 1):
+        """Open sink and write header (CSV only)
+
+        Args:
+            fname (str): Output file
+            headers (List[str]): Column headers; first one is the mail name
+            fmt (str, optional): One of csv|jsonl. Defaults to "csv".
+            sep (str, optional): CSV value separator. Defaults to ",".
+            flush_every (int, optional): Flush file after this many rows. Defaults to 1.
+
+        Raises:
+            ValueError: Unknown format
+        """
+        if fmt not in self.formats:
+            raise ValueError(f"Unknown format '{fmt}'; use one of {self.formats}")
+        self.fname = fname
+        self.headers = headers
+        self.fmt = fmt
+        self.sep = sep
+        self.flush_every = max(1, flush_every)
+        self.rows = 0
+        self._fp = open(fname, "w", encoding="utf-8", newline="")
+        self._writer = None
+        if self.fmt == "csv":
+            self._writer = csv.writer(self._fp, delimiter=self.sep, lineterminator="\n")
+            self._writer.writerow(self.headers)
+            self._fp.flush()
+
+    def write(self, result: Result):
+        """Write one result
+
+        Args:
+            result (Result): Result of one mail
+        """
+        values = [result.mail] + [getattr(result, key) if key in ATTRIBUTES else result[key]
+                                  for key in self.headers[1:]]
+        if self.fmt == "csv":
+            self._writer.writerow(values)
+        else:
+            self._fp.write(json.dumps(dict(zip(self.headers, values))) + "\n")
+        self.rows += 1
+        if self.rows % self.flush_every == 0:
+            self._fp.flush()
+
+    def close(self):
+        """Flush and close output file
+        """
+        if not self._fp.closed:
+            self._fp.flush()
+            self._fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
@@ -0,0 +1,494 @@
+# Copyright 2022 Jakob Schaffarczyk
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Importable API to run all checks on mails
+
+Example:
+    >>> analyzer = Analyzer()
+    >>> result = analyzer.analyze_path("incidents/1234_mail.eml")
+    >>> for result in analyzer.analyze_many(paths, jobs=4):
+    ...     print(result.data())
+"""
+from multiprocessing import Pool, current_process
+from multiprocessing.util import Finalize
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+import cProfile
+import importlib
+import sys
+import time
+
+from cache import ResultCache, file_digest, mail_digest
+from profiler import timed_call
+from scheduler import Scheduler
+from sources import Mail, mail_name, open_mail
+from Report.result import Result
+
+# Arguments and cost class (see scheduler.COSTS) of every check,
+# in the order the checks are run
+CHECKS: Dict[str, Dict[str, Any]] = {
+    "authenticity_check": {"args": ["headers"], "cost": "header"},
+    "is_from_external": {"args": ["headers", "addr"], "cost": "header"},
+    "is_denylisted": {"args": ["addr"], "cost": "header"},
+    # INFO: Not mentioned in BA
+    "contains_buzzword": {"args": ["content"], "cost": "text"},
+    "has_coin_addr": {"args": ["content"], "cost": "text"},
+    "is_faked_sender": {"args": ["addr"], "cost": "header"},
+    "contains_greeting": {"args": ["content", "headers"], "cost": "nlp"},
+    "is_unusual_subject": {"args": ["headers"], "cost": "header"},
+    "is_sus_date": {"args": ["headers"], "cost": "header"},
+    "is_domain_working": {"args": ["addr", "domain_status"], "cost": "network"},
+    "check_language_quality": {"args": ["content"], "cost": "nlp"},
+    "get_mail_intention": {"args": ["content"], "cost": "nlp"},
+    "is_typosquatted": {"args": ["addr"], "cost": "header"},
+}
+
+# Weighted score and verdict follow the checks (see scheduler.py)
+HEADERS: list[str] = ["eml_name"] + list(CHECKS) + ["score", "verdict"]
+
+# Heavy modules needed by the checks of a cost class; imported by warm_up
+# only if one of the selected checks needs them
+WARM_UP: Dict[str, List[str]] = {
+    "header": [],
+    "text": ["fuzzywuzzy"],
+    "nlp": ["nltk", "textblob", "textblob_de", "language_tool_python", "langdetect"],
+    "network": ["netcheck"],
+}
+
+# Analyzer of the current worker process; set by __init_worker
+_ANALYZER: Optional["Analyzer"] = None
+
+
+class Analyzer:
+    """Run all checks on mails; heavy modules and data files are loaded
+    once on creation and reused for every analyzed mail
+    """
+
+    def __init__(self, jobs: int = 1, chunksize: int = 16, verbose: bool = True,
+                 languagetool_server: Optional[str] = None, cache_dir: Optional[str] = None,
+                 profile: bool = False, early_exit: bool = False, headers_only: bool = False,
+                 checks: Optional[List[str]] = None, warm: bool = True):
+        """Init analyzer and warm up the selected checks
+
+        Args:
+            jobs (int, optional): Default number of worker processes for analyze_many. Defaults to 1.
+            chunksize (int, optional): Number of mails handed to a worker at once. Defaults to 16.
+            verbose (bool, optional): Print one line per analyzed mail. Defaults to True.
+            languagetool_server (Optional[str], optional): URL of a running LanguageTool
+                server shared by all workers. Defaults to settings.languagetool_server.
+            cache_dir (Optional[str], optional): Directory of the result cache;
+                None disables caching. Defaults to None.
+            profile (bool, optional): Attach cProfile stats to every result. Defaults to False.
+            early_exit (bool, optional): Run cheap checks first and skip the rest once
+                the weighted verdict is fixed; skipped checks are None. Defaults to False.
+            headers_only (bool, optional): Read only the header block of every mail and
+                run only header checks; all other checks are None. Defaults to False.
+            checks (Optional[List[str]], optional): Names of the checks to run; all other
+                checks are None and their modules are never imported. Defaults to all checks.
+            warm (bool, optional): Import heavy modules of the selected checks on creation;
+                False defers every import to the first mail that needs it (single mail
+                runs). Defaults to True.
+
+        Raises:
+            ValueError: Unknown check in `checks`
+        """
+        self.jobs = jobs
+        self.chunksize = chunksize
+        self.verbose = verbose
+        self.languagetool_server = languagetool_server
+        self.cache_dir = cache_dir
+        self.profile = profile
+        self.early_exit = early_exit
+        self.headers_only = headers_only
+        self.selected = None
+        if checks is not None:
+            unknown = [check for check in checks if check not in CHECKS]
+            if unknown:
+                raise ValueError(f"Unknown check(s): {', '.join(unknown)}")
+            self.selected = [check for check in CHECKS if check in checks]
+        self.warm = warm
+        self.cache = None
+        if cache_dir:
+            self.cache = ResultCache(cache_dir, mode=self.mode())
+        self.scheduler = Scheduler(early_exit=early_exit)
+        self.order = [check for check in self.scheduler.order(CHECKS)
+                      if (not headers_only or CHECKS[check]["cost"] == "header")
+                      and (self.selected is None or check in self.selected)]
+        self.checks = None
+        self.helper = None
+        self.classes = None
+        self.net = None
+        # Importing checks pulls in settings and the data files; the
+        # modules of the checks themselves are imported on first use
+        self.checks = importlib.import_module("checks")
+        self.helper = importlib.import_module("helper")
+        self.classes = importlib.import_module("classes")
+        if self.languagetool_server is not None:
+            importlib.import_module("langtool").configure(remote_server=self.languagetool_server)
+        if warm:
+            self.warm_up()
+
+    def warm_up(self):
+        """Import the heavy modules (nltk, textblob, language_tool_python,
+        asyncio etc.) of the selected checks and load the langdetect profiles
+        """
+        costs = {CHECKS[check]["cost"] for check in self.order}
+        for cost in costs:
+            for module in WARM_UP[cost]:
+                importlib.import_module(module)
+        if "network" in costs:
+            self.net = importlib.import_module("netcheck").NetChecker()
+        if "nlp" in costs:
+            detector_factory = importlib.import_module("langdetect.detector_factory")
+            detector_factory.init_factory()
+
+    def analyze_path(self, path: Mail) -> Result:
+        """Run all checks on one .eml file
+
+        Args:
+            path (Mail): Path to .eml file or reference into an mbox/Maildir
+
+        Returns:
+            Result: Results of all checks
+        """
+        digest = self._digest(path)
+        result = self._cached(digest, mail_name(path))
+        if result is None:
+            result = self.analyze_eml(self._read(path), mail_name(path))
+            if self.cache:
+                self.cache.put(digest, result)
+        return result
+
+    def analyze_bytes(self, data: bytes, name: str = "<bytes>") -> Result:
+        """Run all checks on one raw mail
+
+        Args:
+            data (bytes): Raw mail (RFC 822)
+            name (str, optional): Name of the mail in the result. Defaults to "<bytes>".
+
+        Returns:
+            Result: Results of all checks
+        """
+        digest = mail_digest(data) if self.cache else None
+        result = self._cached(digest, name)
+        if result is None:
+            eml = self.helper.read_eml_bytes(data, headers_only=self.headers_only)
+            result = self.analyze_eml(eml, name)
+            if self.cache:
+                self.cache.put(digest, result)
+        return result
+
+    def analyze_eml(self, eml: dict, name: str,
+                    domain_status: Optional[Dict[str, int]] = None) -> Result:
+        """Run all checks on parsed mail
+
+        Args:
+            eml (dict): Mail context as returned by helper.read_eml
+            name (str): Name of the mail in the result
+            domain_status (Optional[Dict[str, int]], optional): Prefetched results
+                of NetChecker.check_domains. Defaults to None (checked with the
+                analyzer's NetChecker if the mail is undecided after the local checks).
+
+        Returns:
+            Result: Results of all checks
+        """
+        mail = self._prepare(eml, name)
+        if domain_status is None:
+            self._run_checks(mail, network=False)
+            domain_status = self._domain_status([mail]) if mail["pending"] else {}
+        mail["domain_status"] = domain_status
+        self._run_checks(mail)
+        return self._finish(mail)
+
+    def analyze_chunk(self, paths: List[Mail]) -> List[Result]:
+        """Run all checks on a chunk of .eml files; the network checks of all
+        mails still undecided after the local checks run concurrently
+
+        Args:
+            paths (List[Mail]): Paths to .eml files or references into mbox/Maildir
+
+        Returns:
+            List[Result]: Results in the same order as `paths`
+        """
+        names = [mail_name(path) for path in paths]
+        digests = [self._digest(path) for path in paths]
+        results = [self._cached(digest, name) for digest, name in zip(digests, names)]
+        todo = [i for i, result in enumerate(results) if result is None]
+
+        mails = {i: self._prepare(self._read(paths[i]), names[i]) for i in todo}
+        for mail in mails.values():
+            self._run_checks(mail, network=False)
+        waiting = [mail for mail in mails.values() if mail["pending"]]
+        domain_status = self._domain_status(waiting)
+        for mail in waiting:
+            mail["domain_status"] = domain_status
+            self._run_checks(mail)
+        for i, mail in mails.items():
+            results[i] = self._finish(mail)
+        if self.cache and todo:
+            self.cache.put_many([(digests[i], results[i]) for i in todo])
+        return results
+
+    def analyze_many(self, paths: Iterable[Mail], jobs: Optional[int] = None) -> Iterator[Result]:
+        """Run all checks on many .eml files
+
+        Args:
+            paths (Iterable[Mail]): Paths to .eml files or references into mbox/Maildir
+                (see sources.iter_source)
+            jobs (Optional[int], optional): Number of worker processes. Defaults to self.jobs.
+
+        Yields:
+            Iterator[Result]: Results in the same order as `paths`
+        """
+        jobs = self.jobs if jobs is None else jobs
+        chunks = _chunked(paths, self.chunksize)
+        if jobs <= 1:
+            for chunk in chunks:
+                yield from self.analyze_chunk(chunk)
+            return
+        # close() + join() lets the workers exit normally so their
+        # finalizers (see _init_worker) run; terminate() only on errors
+        pool = Pool(processes=jobs, initializer=_init_worker, initargs=(self.options(),))
+        try:
+            for results in pool.imap(_analyze_chunk, chunks):
+                yield from results
+            pool.close()
+        except BaseException:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+    def options(self) -> Dict[str, Any]:
+        """Options to create an equivalent analyzer in a worker process
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for Analyzer
+        """
+        return {
+            "verbose": self.verbose,
+            "languagetool_server": self.languagetool_server,
+            "cache_dir": self.cache_dir,
+            "profile": self.profile,
+            "early_exit": self.early_exit,
+            "headers_only": self.headers_only,
+            "checks": self.selected,
+        }
+
+    def mode(self) -> str:
+        """Options that change the results; cached results are kept apart per mode
+
+        Returns:
+            str: e.g. "early-exit+headers-only"; empty for the full analysis
+        """
+        flags = {"early-exit": self.early_exit, "headers-only": self.headers_only}
+        mode = [flag for flag, active in flags.items() if active]
+        if self.selected is not None:
+            mode.append("checks=" + ",".join(self.selected))
+        return "+".join(mode)
+
+    def _read(self, path: Mail) -> dict:
+        """internal: Parse mail (only the header block in headers_only mode)
+
+        Args:
+            path (Mail): Path to .eml file or reference into mbox/Maildir
+
+        Returns:
+            dict: Mail context as returned by helper.read_eml
+        """
+        with open_mail(path) as fp:
+            return self.helper.read_eml_fp(fp, headers_only=self.headers_only)
+
+    def _digest(self, path: Mail) -> Optional[str]:
+        """internal: SHA-256 of the mail (of the header block in headers_only mode)
+
+        Args:
+            path (Mail): Path to .eml file or reference into mbox/Maildir
+
+        Returns:
+            Optional[str]: Hex digest; None if caching is disabled
+        """
+        if self.cache is None:
+            return None
+        with open_mail(path) as fp:
+            if self.headers_only:
+                return mail_digest(self.helper.read_header_block(fp))
+            return file_digest(fp)
+
+    def _cached(self, digest: Optional[str], name: str) -> Optional[Result]:
+        """internal: Look up result in the cache
+
+        Args:
+            digest (Optional[str]): SHA-256 of raw mail; None if caching is disabled
+            name (str): Name of the mail in the result
+
+        Returns:
+            Optional[Result]: Cached result; None if missing
+        """
+        if digest is None:
+            return None
+        result = self.cache.get(digest, name)
+        if result is not None:
+            result.score = self.scheduler.score(result.data())
+            result.verdict = self.scheduler.verdict(result.score)
+            if self.verbose:
+                time_stamp: str = time.strftime("%d/%m/%Y %H:%M:%S")
+                print(f"[{time_stamp}] {current_process().name} :: {name} (cached)")
+        return result
+
+    def _domain_status(self, mails: List[Dict[str, Any]]) -> Dict[str, int]:
+        """internal: Check sender domains of prepared mails concurrently with
+        the NetChecker of the analyzer; free mail providers are skipped
+
+        Args:
+            mails (List[Dict[str, Any]]): Prepared mails
+
+        Returns:
+            Dict[str, int]: Result of NetChecker.check_domains per domain
+        """
+        domains = [mail["addr"]["domain"] for mail in mails
+                   if mail["addr"]["domain"]
+                   and mail["addr"]["domain"] not in self.checks.mail_providers]
+        if not domains:
+            return {}
+        if self.net is None:
+            self.net = importlib.import_module("netcheck").NetChecker()
+        return self.net.check_domains(domains)
+
+    def _prepare(self, eml: dict, name: str) -> Dict[str, Any]:
+        """internal: Build content, headers and sender objects of parsed mail
+
+        Args:
+            eml (dict): Mail context as returned by helper.read_eml
+            name (str): Name of the mail in the result
+
+        Returns:
+            Dict[str, Any]: Objects used by the checks and state of the run
+        """
+        if self.verbose:
+            time_stamp: str = time.strftime("%d/%m/%Y %H:%M:%S")
+            print(f"[{time_stamp}] {current_process().name} :: {name}")
+        mail_headers = eml["Headers"]
+        return {
+            "content": self.classes.Content(eml["Body"]),
+            "headers": mail_headers,
+            "addr": self.classes.mailAddr(mail_headers["From"]),
+            "domain_status": None,
+            "result": Result(name),
+            "score": 0,
+            "pending": list(self.order),
+            "profile": cProfile.Profile() if self.profile else None,
+        }
+
+    def _run_checks(self, mail: Dict[str, Any], network: bool = True):
+        """internal: Run pending checks of prepared mail in scheduler order
+
+        Args:
+            mail (Dict[str, Any]): Prepared mail
+            network (bool, optional): Run network checks; stop at the first one if False. Defaults to True.
+        """
+        result: Result = mail["result"]
+        profile = mail["profile"]
+        if profile:
+            profile.enable()
+        try:
+            while mail["pending"]:
+                check = mail["pending"][0]
+                if not network and CHECKS[check]["cost"] == "network":
+                    break
+                mail["pending"].pop(0)
+                try:
+                    result[check] = timed_call(result.timings, check, getattr(self.checks, check),
+                                               *[mail[arg] for arg in CHECKS[check]["args"]])
+                except Exception:
+                    # One broken mail must not stop the run; the error is
+                    # kept in the timing record (see profiler.RunStats)
+                    result[check] = None
+                    continue
+                mail["score"] += self.scheduler.contribution(check, result[check])
+                if self.scheduler.decided(mail["score"], mail["pending"]):
+                    mail["pending"] = []
+        finally:
+            if profile:
+                profile.disable()
+
+    def _finish(self, mail: Dict[str, Any]) -> Result:
+        """internal: Finalize result of prepared mail
+
+        Args:
+            mail (Dict[str, Any]): Prepared mail with all checks run or skipped
+
+        Returns:
+            Result: Results of all checks
+        """
+        result: Result = mail["result"]
+        # CHECKS order; checks skipped by early exit, headers_only or
+        # the check selection are None
+        data = result.data()
+        ordered = {check: data.get(check) for check in CHECKS}
+        data.clear()
+        data.update(ordered)
+        result.score = mail["score"]
+        failed = [record["check"] for record in result.timings if record["error"]]
+        result.verdict = self.scheduler.verdict(mail["score"], failed)
+        if mail["profile"]:
+            mail["profile"].create_stats()
+            result.profile = mail["profile"].stats
+        return result
+
+
+def _chunked(paths: Iterable[Mail], size: int) -> Iterator[List[Mail]]:
+    """internal: Split paths into chunks
+
+    Args:
+        paths (Iterable[Mail]): Paths to .eml files or MailRefs
+        size (int): Chunk size
+
+    Yields:
+        Iterator[List[Mail]]: Chunks of at most `size` paths
+    """
+    paths = iter(paths)
+    while chunk := list(islice(paths, max(1, size))):
+        yield chunk
+
+
+def _init_worker(options: Dict[str, Any]):
+    """internal: Create one warmed up analyzer per worker process
+
+    Args:
+        options (Dict[str, Any]): Keyword arguments for Analyzer
+    """
+    global _ANALYZER
+    _ANALYZER = Analyzer(**options)
+    # atexit handlers don't run in pool workers
+    Finalize(None, _close_worker, exitpriority=10)
+
+
+def _close_worker():
+    """internal: Shut down the LanguageTool instances of the worker process
+    """
+    langtool = sys.modules.get("langtool")
+    if langtool is not None:
+        langtool.LANGUAGE_TOOLS.close()
+
+
+def _analyze_chunk(paths: List[Mail]) -> List[Result]:
+    """internal: Analyze chunk with the analyzer of the worker process
+
+    Args:
+        paths (List[Mail]): Paths to .eml files or MailRefs
+
+    Returns:
+        List[Result]: Results in the same order as `paths`
+    """
+    return _ANALYZER.analyze_chunk(paths)
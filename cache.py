@@ -0,0 +1,172 @@
+# Copyright 2022 Jakob Schaffarczyk
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""On-disk result cache keyed by the SHA-256 of the raw .eml bytes
+"""
+from pathlib import Path
+from typing import BinaryIO, Iterable, List, Optional, Tuple
+import hashlib
+import json
+import os
+import sqlite3
+from Report.result import Result
+
+# Bump when the layout of cached rows or of the table changes; stored as
+# PRAGMA user_version, a database of another version is recreated
+SCHEMA_VERSION = 2
+ROOT = Path(__file__).resolve().parent
+
+
+def checks_version() -> str:
+    """Fingerprint of the check set and all data files; every change of
+    a module next to this one or of data/* invalidates all cached results
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256(str(SCHEMA_VERSION).encode())
+    files = sorted(ROOT.glob("*.py")) + sorted((ROOT / "data").glob("*"))
+    for fname in files:
+        if not fname.is_file():
+            continue
+        digest.update(fname.relative_to(ROOT).as_posix().encode())
+        digest.update(fname.read_bytes())
+    return digest.hexdigest()
+
+
+def mail_digest(data: bytes) -> str:
+    """SHA-256 of raw mail
+
+    Args:
+        data (bytes): Raw mail
+
+    Returns:
+        str: Hex digest
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_digest(fp: BinaryIO) -> str:
+    """SHA-256 of raw mail file, read in chunks
+
+    Args:
+        fp (BinaryIO): Mail file opened in binary mode
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    while chunk := fp.read(1024 * 1024):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """SQLite backed cache of complete result rows
+    """
+
+    def __init__(self, cache_dir: str = ".cache", version: Optional[str] = None, mode: str = ""):
+        """Open (or create) cache and drop rows of other check versions;
+        the table is recreated if it was written with another schema version
+
+        Args:
+            cache_dir (str, optional): Directory of the cache database. Defaults to ".cache".
+            version (Optional[str], optional): Check set version. Defaults to checks_version().
+            mode (str, optional): Analyzer mode; results of different modes are kept apart. Defaults to "".
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        self.fname = os.path.join(cache_dir, "results.sqlite3")
+        self.version = checks_version() if version is None else version
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self._db = sqlite3.connect(self.fname, timeout=60)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._migrate()
+        self.invalidate()
+
+    def _migrate(self):
+        """internal: Recreate results table if its schema version differs
+        """
+        with self._db:
+            # BEGIN IMMEDIATE so concurrent workers don't drop the table twice
+            self._db.execute("BEGIN IMMEDIATE")
+            (user_version,) = self._db.execute("PRAGMA user_version").fetchone()
+            if user_version != SCHEMA_VERSION:
+                self._db.execute("DROP TABLE IF EXISTS results")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "digest TEXT NOT NULL, version TEXT NOT NULL, mode TEXT NOT NULL, "
+                "data TEXT NOT NULL, PRIMARY KEY (digest, version, mode))")
+            self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def invalidate(self, everything: bool = False):
+        """Delete stale rows
+
+        Args:
+            everything (bool, optional): Delete rows of the current version too. Defaults to False.
+        """
+        with self._db:
+            if everything:
+                self._db.execute("DELETE FROM results")
+            else:
+                self._db.execute("DELETE FROM results WHERE version != ?", (self.version,))
+
+    def get(self, digest: str, name: str) -> Optional[Result]:
+        """Get cached result
+
+        Args:
+            digest (str): SHA-256 of raw mail
+            name (str): Name of the mail in the result
+
+        Returns:
+            Optional[Result]: Cached result; None if missing
+        """
+        row = self._db.execute(
+            "SELECT data FROM results WHERE digest = ? AND version = ? AND mode = ?",
+            (digest, self.version, self.mode)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        result = Result(name)
+        for key, val in json.loads(row[0]).items():
+            result[key] = val
+        return result
+
+    def put_many(self, items: Iterable[Tuple[str, Result]]):
+        """Store results; results with a failed check are not stored, so the
+        check runs again next time
+
+        Args:
+            items (Iterable[Tuple[str, Result]]): Pairs of SHA-256 of raw mail and result
+        """
+        rows: List[Tuple[str, str, str, str]] = [
+            (digest, self.version, self.mode, json.dumps(result.data())) for digest, result in items
+            if not any(record["error"] for record in result.timings)]
+        with self._db:
+            self._db.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)", rows)
+
+    def put(self, digest: str, result: Result):
+        """Store result
+
+        Args:
+            digest (str): SHA-256 of raw mail
+            result (Result): Result of all checks
+        """
+        self.put_many([(digest, result)])
+
+    def close(self):
+        """Close database
+        """
+        self._db.close()
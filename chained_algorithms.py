@@ -14,111 +14,100 @@
 """Mail file to run all implemented checks on one mail or a whole folder
 """
 
-from threading import Thread
-from typing import List
-import time
-import glob
-import sys
+from typing import Iterator
+import argparse
+import os
 
-from checks import authenticity_check
-from checks import is_from_external
-from checks import is_denylisted
-# from checks import contains_buzzword
-from checks import has_coin_addr
-from checks import is_faked_sender
-from checks import contains_greeting
-from checks import is_unusual_subject
-from checks import is_sus_date
-from checks import is_domain_working
-from checks import check_language_quality
-from checks import get_mail_intention
-from checks import is_typosquatted
+from analyzer import Analyzer, CHECKS, HEADERS
+from profiler import RunStats
+from sources import Mail, is_mbox, iter_source
+from Report.sink import ResultSink
 
-from classes import mailAddr, Content, Headers
-from helper import read_eml
-from Report.result import Result
-from Report.report import Report
 
-
-headers: list[str] = [
-    "eml_name",
-    "authenticity_check",
-    "is_from_external",
-    "is_denylisted",
-    # "contains_buzzword",
-    "has_coin_addr",
-    "is_faked_sender",
-    "contains_greeting",
-    "is_unusual_subject",
-    "is_sus_date",
-    "is_domain_working",
-    "check_language_quality",
-    "get_mail_intention",
-    "is_typosquatted"
-]
-
-results: List[Result] = []
-procs: List[Thread] = []
-
-if len(sys.argv) == 1:
-    mails: List[str] = glob.glob("incidents/*.eml")
-else:
-    mails = [sys.argv[1]]
-
-
-def run(pid: int = 0):
-    """Run all checks
-
-    Args:
-        pid (int): Process ID if threaded; defaults to 0
+def main():
+    """Parse arguments, run checks and write report
     """
-    while mails:
-        mail: str = mails.pop(0)
-        time_stamp: str = time.strftime("%d/%m/%Y %H:%M:%S")
-        print(f"[{time_stamp}] Thread #{pid} :: {mail}")
-        eml: dict = read_eml(mail)
-        content: Content = Content(eml["Body"])
-        mail_headers: Headers = Headers(eml["Headers"])
-        mail_addr: mailAddr = mailAddr(mail_headers["From"])
-
-        result: Result = Result(mail)
-        result["authenticity_check"] = authenticity_check(mail_headers)
-        result["is_from_external"] = is_from_external(mail_headers, mail_addr)
-        result["is_denylisted"] = is_denylisted(mail_addr)
-        result["has_coin_addr"] = has_coin_addr(content)
-        result["is_faked_sender"] = is_faked_sender(mail_addr)
-        result["contains_greeting"] = contains_greeting(content, mail_headers)
-        result["is_unusual_subject"] = is_unusual_subject(mail_headers)
-        result["is_sus_date"] = is_sus_date(mail_headers)
-        # INFO: Not mentioned in BA
-        # result["contains_buzzword"] = contains_buzzword(content)
-        result["is_domain_working"] = is_domain_working(mail_addr)
-        result["check_language_quality"] = check_language_quality(content)
-        result["get_mail_intention"] = get_mail_intention(content)
-        result["is_typosquatted"] = is_typosquatted(mail_addr)
-
-        results.append(result)
-
-# for pid in range(jobs):
-#     procs.append(Thread(target=run, args=(pid,)))
-# for proc in procs:
-#     proc.start()
-# for proc in procs:
-#     proc.join()
-
-
-run(0)
-
-report = Report()
-report.set_headers(headers)
-# Need to reformat data; due to usage of a stupid custom class
-data = [[result.mail] + result.values() for result in results]
-report.set_data(data)
-if len(sys.argv) == 1:
-    report.save("report.xlsx")
-    report.as_csv("report.csv", sep=";")
-else:
-    row = results[0].data()
-    for k in row:
-        v = results[0].row[k]
-        print(f"{k} :: {v}")
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("source", nargs="?", default="incidents",
+                        help="Single .eml file to analyze, or folder with .eml files, "
+                             "mbox file or Maildir to analyze in batch; defaults to incidents/")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Number of worker processes")
+    parser.add_argument("--chunksize", type=int, default=16,
+                        help="Number of mails handed to a worker at once")
+    parser.add_argument("-f", "--format", choices=ResultSink.formats, default="csv",
+                        help="Format of the streamed result file")
+    parser.add_argument("-o", "--output", default=None,
+                        help="Streamed result file; defaults to report.csv|report.jsonl")
+    parser.add_argument("--flush-every", type=int, default=1,
+                        help="Flush result file after this many mails")
+    parser.add_argument("--languagetool-server", default=None,
+                        help="URL of a running LanguageTool server shared by all workers")
+    parser.add_argument("--cache-dir", default=".cache",
+                        help="Directory of the result cache")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Analyze every mail again, ignoring the result cache")
+    parser.add_argument("--early-exit", action="store_true",
+                        help="Run cheap checks first and skip the rest once the verdict is fixed")
+    parser.add_argument("--headers-only", action="store_true",
+                        help="Read only the header block and run only header checks")
+    parser.add_argument("--checks", default=None,
+                        help="Comma separated checks to run, all others are skipped and "
+                             "never imported; one of: " + ", ".join(CHECKS))
+    parser.add_argument("--trace", default=None,
+                        help="JSON Lines file with timings of every check per mail")
+    parser.add_argument("--profile", type=int, default=0, metavar="N",
+                        help="Dump cProfile stats of the slowest N mails")
+    parser.add_argument("--profile-dir", default="profiles",
+                        help="Directory for the cProfile stats")
+    args = parser.parse_args()
+    if not os.path.exists(args.source):
+        parser.error(f"source '{args.source}' does not exist")
+
+    single = os.path.isfile(args.source) and not is_mbox(args.source)
+    checks = [check.strip() for check in args.checks.split(",")] if args.checks else None
+    try:
+        # A single mail imports only what its checks actually use
+        analyzer = Analyzer(jobs=args.jobs, chunksize=args.chunksize,
+                            languagetool_server=args.languagetool_server,
+                            cache_dir=None if args.no_cache else args.cache_dir,
+                            profile=args.profile > 0, early_exit=args.early_exit,
+                            headers_only=args.headers_only, checks=checks, warm=not single)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if single:
+        result = analyzer.analyze_path(args.source)
+        for k, v in result.data().items():
+            print(f"{k} :: {v}")
+        for record in result.timings:
+            if record["error"]:
+                print(f"error :: {record['check']} :: {record['error']}")
+        print(f"score :: {result.score}")
+        print(f"verdict :: {result.verdict}")
+        return
+
+    mails: Iterator[Mail] = iter_source(args.source)
+    output = args.output or f"report.{args.format}"
+    stats = RunStats(trace_file=args.trace, profile_top=args.profile)
+    with ResultSink(output, HEADERS, fmt=args.format, flush_every=args.flush_every) as sink:
+        for result in analyzer.analyze_many(mails):
+            stats.add(result)
+            sink.write(result)
+    stats.close()
+    print(stats.format_summary())
+    if args.profile:
+        for fname in stats.dump_profiles(args.profile_dir):
+            print(f"cProfile stats :: {fname}")
+
+    # Build XLSX report from the streamed rows once all mails are done
+    from Report.report import Report
+    report = Report()
+    if args.format == "csv":
+        report.from_csv(output, "report.xlsx")
+    else:
+        report.from_jsonl(output, "report.xlsx")
+
+
+if __name__ == "__main__":
+    main()
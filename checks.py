@@ -15,27 +15,33 @@
 
 Returns:
     _type_: Analysis methods
+
+Heavy modules (nltk, textblob, LanguageTool, asyncio, fuzzywuzzy) and
+large data structures are imported/built by the checks on first use, so
+running a subset of the checks never loads the others' dependencies
 """
 from datetime import datetime
-from threading import Thread
-import socket
-import re
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 from difflib import SequenceMatcher
-from textblob_de import TextBlobDE
-from textblob import TextBlob
-from fuzzywuzzy import fuzz
-import language_tool_python
-import langdetect
-import nltk
 from settings import reputation, mail_denylist, mail_allowlist
 from settings import buzzwords_evil, buzzwords_spam, subject_blocklist
-from settings import mail_providers, mail_ports, languages, abused_tlds, typosq, money
-from helper import dist_split, fmt_displ_name, fmt_local_part, debug, levenshteinDist
+from settings import mail_providers, abused_tlds, typosq, money
+from helper import fmt_displ_name, fmt_local_part
 from authenticity import check_spf, check_dkim, check_dmarc, auth_check
 from classes import Headers, Content, mailAddr
-from emojis import EMOJIS
+from distance import within
+
+
+@lru_cache(maxsize=None)
+def buzzword_matchers() -> Tuple["PhraseMatcher", "PhraseMatcher"]:
+    """Compile buzzword lists on first use
 
-RESULTS = {}
+    Returns:
+        Tuple[PhraseMatcher, PhraseMatcher]: Matcher of evil and spam buzzwords
+    """
+    from fuzzymatch import PhraseMatcher
+    return PhraseMatcher(buzzwords_evil), PhraseMatcher(buzzwords_spam)
 
 
 def authenticity_check(headers: Headers) -> float:
@@ -101,25 +107,16 @@ def contains_buzzword(rawtext: Content) -> float:
     """
     text = rawtext.lower()
     score = 0
-    for word in buzzwords_evil:
-        word = word.lower()
-        word_len = len(word.split(" "))
-        split_text = dist_split(text, word_len)
-        similarity = max([fuzz.ratio(word, st) for st in split_text])
-        if similarity >= 90:
+    evil, spam = buzzword_matchers()
+    for level in evil.levels(rawtext):
+        if level >= 90:
             score += 2
-        elif similarity >= 70:
+        elif level >= 70:
             score += 1
-    for word in buzzwords_spam:
-        word = word.lower()
-        word_len = len(word.split(" "))
-        split_text = dist_split(text, word_len)
-        similarity = max([fuzz.ratio(word, st) for st in split_text])
-        if similarity >= 90:
-            debug("80% " + word)
+    for level in spam.levels(rawtext):
+        if level >= 90:
             score += 1
-        elif similarity >= 70:
-            debug("50% " + word)
+        elif level >= 70:
             score += 0.5
     for mail in mail_denylist:
         if mail in text:
@@ -128,22 +125,13 @@ def contains_buzzword(rawtext: Content) -> float:
 
 
 def has_coin_addr(content: Content) -> float:
-    """check if crypto money IOC exists
+    """check if crypto money IOC exists (BTC, Monero, Ethereum)
     :param rawtext: mail content
     :return: score
     """
-    score = 0
-    words = dist_split(str(content), dist=1)
-    for word in words:
-        if re.match(r'^(bc1|[13])[a-zA-HJ-NP-Z0-9]{25,39}$', word):
-            # contains BTC addr
-            # score += 10
-            score += 1
-        if re.match(r'^4[0-9AB][1-9A-HJ-NP-Za-km-z]{93}$', word):
-            # contains Monero addr
-            # score += 10
-            score += 1
-    return score
+    iocs = content.iocs
+    # score += 10 per address
+    return iocs.count("btc") + iocs.count("xmr") + iocs.count("eth")
 
 
 def is_faked_sender(email: mailAddr) -> float:
@@ -183,7 +171,6 @@ def contains_greeting(text: Content, headers: Headers) -> float:
     Returns:
         float: Sum of highest matching ratio for first- and lastname
     """
-    text = str(text)
     sender = mailAddr(headers["From"])
     # Fix issue with non existing From/To Header
     if not sender:
@@ -191,9 +178,7 @@ def contains_greeting(text: Content, headers: Headers) -> float:
     rcpt = mailAddr(headers["To"])
     if not rcpt:
         rcpt = []
-    lang = langdetect.detect(text)
-    words = nltk.word_tokenize(
-        text, language=languages.get(lang, ["en-GB", "english"])[1])
+    words = text.context.words
     first = words[:round(len(words)/10)]
     last = words[len(words)-round(len(words)/10):]
     scores = {"last": [], "first": []}
@@ -224,13 +209,12 @@ def is_unusual_subject(headers: Headers) -> int:
     score = 0
     if money.match(subject):
         score += 2
-    if levenshteinDist(subject, subject.upper()) <= len(subject)*.25:
+    if within(subject, subject.upper(), int(len(subject)*.25)):
         score += 2
-    for char in subject:
-        if ord(char) in EMOJIS:
-            score += 0.5
+    from emojis import count_emojis
+    score += 0.5 * count_emojis(subject)
     for word in subject.split(" "):
-        if word in subject_blocklist:
+        if word.casefold() in subject_blocklist:
             score += 1
     return score
 
@@ -258,48 +242,26 @@ def is_sus_date(headers: Headers) -> int:
     return score
 
 
-def __is_port_open(ip_addr: str, port: int) -> bool:
-    """Helper function to check for open port
-
-    Args:
-        ip_addr (str): IP address
-        port (int): Port
-
-    Returns:
-        bool: Whether port is open or not
-    """
-    global RESULTS
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(2)
-    res = sock.connect_ex((ip_addr, port))
-    RESULTS[port] = int(not bool(res))
-
-
-def is_domain_working(mail: mailAddr) -> bool:
+def is_domain_working(mail: mailAddr, status: Optional[Dict[str, int]] = None) -> int:
     """Check if domain exists and is able to receive mails
 
     Args:
         mail (mailAddr): Mail address object
+        status (Optional[Dict[str, int]]): Results of NetChecker.check_domains
+            prefetched for many mails at once; domain is checked on its own if missing
 
     Returns:
-        bool: Whether domain is functional or not
+        int: Whether domain is functional or not
     """
     domain = mail["domain"]
+    if not domain:
+        return 0
     if domain in mail_providers:
         return 1
-    try:
-        ip_addr = socket.gethostbyname(domain)
-    except socket.gaierror:
-        return 0
-    procs = []
-    for port in mail_ports:
-        procs.append(Thread(target=__is_port_open, args=(ip_addr, port, )))
-    for proc in procs:
-        proc.start()
-    for proc in procs:
-        proc.join()
-
-    return int(True in RESULTS.values())
+    if status is not None and domain in status:
+        return status[domain]
+    from netcheck import NetChecker
+    return NetChecker().check_domains([domain])[domain]
 
 
 def check_language_quality(text: Content) -> float:
@@ -311,13 +273,10 @@ def check_language_quality(text: Content) -> float:
     Returns:
         float: Ratio
     """
-    text = str(text)
-    lang = langdetect.detect(text)
-    tool = language_tool_python.LanguageTool(
-        languages.get(lang, ["en-GB", "english"])[0])
-    sentences = nltk.sent_tokenize(
-        text, language=languages.get(lang, ["en-GB", "english"])[1])
-    matches = tool.check(text)
+    context = text.context
+    sentences = text.sentences
+    from langtool import LANGUAGE_TOOLS
+    matches = LANGUAGE_TOOLS.check(context.language[0], context.text)
     return (100/len(sentences))*len(matches)
 
 
@@ -330,12 +289,7 @@ def get_mail_intention(text: Content) -> float:
     Returns:
         float: Calculated emotion
     """
-    text = str(text)
-    lang = langdetect.detect(text)
-    if lang == "de":
-        blob_text = TextBlobDE(text)
-    else:
-        blob_text = TextBlob(text)
+    blob_text = text.context.blob
     pol, subj = [], []
     for sentence in blob_text.sentences:
         sentiment = sentence.sentiment
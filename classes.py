@@ -16,53 +16,104 @@
 Returns:
     _type_: Classes for mail analysis
 """
+from array import array
 from email.header import decode_header
-from typing import List, Union, Any
+from functools import cached_property
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Tuple, Union, Any
 import re
+from settings import languages
+from ioc import Iocs
+
+# Same separators as helper.clean_text (whitespace and punctuation)
+WORD = re.compile(r'[^\s!#$%&*+/=?^_`{|}.~,]+')
 
 
 class Headers:
     """class to allow easy key/value access on
-    json object with email headers
-    TODO: Type for email (Message) not set
+    json object with email headers; values are kept raw and
+    decoded on first access, repeated headers are kept in order
 
     Returns:
         Headers: Header class
     """
+    __slots__ = ("_names", "_raw", "_decoded")
 
     def __init__(self, msg):
         """Init mail header object for easy header access
 
         Args:
-            msg (_type_): Mail object (?)
+            msg (Message): Parsed mail (email.message.Message)
         """
-        self.headers: dict = {}
-        for key in msg.keys():
-            val, encoding = decode_header(msg.get(key))[0]
-            if isinstance(val, bytes):
-                if encoding is None:
-                    encoding = "utf-8"
-                val = val.decode(encoding)
-            self.headers[key] = val
+        self._names: List[str] = []
+        self._raw: Dict[str, List[str]] = {}
+        self._decoded: Dict[str, List[str]] = {}
+        for key, val in msg.raw_items():
+            lkey = key.lower()
+            if lkey not in self._raw:
+                self._names.append(key)
+                self._raw[lkey] = []
+            self._raw[lkey].append(val)
+
+    @staticmethod
+    def _decode(val: str) -> str:
+        """internal: Decode raw header value (RFC 2047 encoded words)
 
-    def __getitem__(self, key: str, default: Any = None) -> Union[dict, list, str, int, None]:
-        """Get value from header
+        Args:
+            val (str): Raw header value; 8bit bytes are surrogate escaped
+
+        Returns:
+            str: Decoded value
+        """
+        try:
+            val.encode("ascii")
+        except UnicodeEncodeError:
+            # raw 8bit header, no encoded words to decode
+            return val.encode("ascii", "surrogateescape").decode("utf-8", "replace")
+        val, encoding = decode_header(val)[0]
+        if isinstance(val, bytes):
+            try:
+                val = val.decode(encoding or "utf-8")
+            except (LookupError, UnicodeDecodeError):
+                val = val.decode("utf-8", "replace")
+        return val
+
+    def get_all(self, key: str, default: Any = None) -> Union[List[str], Any]:
+        """Get all values of repeated header (e.g. Received), in mail order
 
         Args:
             key (str): Key
             default (Any, optional): Default value. Defaults to None.
 
         Returns:
-            Union[dict, list, str, int, None]: Value
+            Union[List[str], Any]: Decoded values
         """
+        lkey = key.lower()
         try:
-            return self.headers[key]
+            return self._decoded[lkey]
         except KeyError:
-            val = default
-        return val
+            pass
+        try:
+            raw = self._raw[lkey]
+        except KeyError:
+            return default
+        vals = self._decoded[lkey] = [self._decode(val) for val in raw]
+        return vals
+
+    def __getitem__(self, key: str, default: Any = None) -> Union[dict, list, str, int, None]:
+        """Get (first) value from header
+
+        Args:
+            key (str): Key
+            default (Any, optional): Default value. Defaults to None.
+
+        Returns:
+            Union[dict, list, str, int, None]: Value
+        """
+        return self.get(key, default)
 
     def get(self, key: str, default: Any = None) -> Union[dict, list, str, int, None]:
-        """_summary_
+        """Get (first) value from header
 
         Args:
             key (str): Key
@@ -71,11 +122,21 @@ class Headers:
         Returns:
             Union[dict, list, str, int, None]: Value
         """
-        try:
-            val = self.headers[key]
-        except KeyError:
-            val = default
-        return val
+        vals = self.get_all(key)
+        if vals is None:
+            return default
+        return vals[0]
+
+    def __contains__(self, key: str) -> bool:
+        """Check if header exists
+
+        Args:
+            key (str): Key
+
+        Returns:
+            bool: Whether header exists
+        """
+        return key.lower() in self._raw
 
     def keys(self) -> List[str]:
         """Return all keys from object
@@ -83,7 +144,7 @@ class Headers:
         Returns:
             List[str]: List of keys
         """
-        return list(self.headers.keys())
+        return list(self._names)
 
 
 class mailAddr:
@@ -170,6 +231,152 @@ class mailAddr:
         return self._address
 
 
+class Tokens:
+    """Sequence of tokens stored as (start, end) offsets into one string;
+    token strings are only sliced out when accessed
+    """
+    __slots__ = ("text", "_spans")
+
+    def __init__(self, text: str, spans: Iterable[Tuple[int, int]]):
+        """Init token sequence
+
+        Args:
+            text (str): Text the offsets point into
+            spans (Iterable[Tuple[int, int]]): (start, end) offset of each token
+        """
+        self.text = text
+        self._spans = array("L", chain.from_iterable(spans))
+
+    def __len__(self) -> int:
+        """Number of tokens
+
+        Returns:
+            int: Number of tokens
+        """
+        return len(self._spans) // 2
+
+    def span(self, idx: int) -> Tuple[int, int]:
+        """Get offsets of token
+
+        Args:
+            idx (int): Index of token
+
+        Raises:
+            IndexError: Index out of range
+
+        Returns:
+            Tuple[int, int]: (start, end) offset into text
+        """
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("token index out of range")
+        return self._spans[2 * idx], self._spans[2 * idx + 1]
+
+    def spans(self) -> Iterator[Tuple[int, int]]:
+        """Iterate over offsets of all tokens
+
+        Returns:
+            Iterator[Tuple[int, int]]: (start, end) offsets
+        """
+        spans = self._spans
+        for pos in range(0, len(spans), 2):
+            yield spans[pos], spans[pos + 1]
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[str, List[str]]:
+        """Get token(s)
+
+        Args:
+            idx (Union[int, slice]): Index or slice
+
+        Returns:
+            Union[str, List[str]]: Token or list of tokens
+        """
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        start, end = self.span(idx)
+        return self.text[start:end]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over tokens
+
+        Returns:
+            Iterator[str]: Tokens
+        """
+        text = self.text
+        for start, end in self.spans():
+            yield text[start:end]
+
+
+class TextContext:
+    """Per-mail analysis context; every step is computed at most once
+    and only when a check asks for it
+    """
+
+    def __init__(self, text: str):
+        """Init analysis context
+
+        Args:
+            text (str): Mail content
+        """
+        self.text = text
+
+    @cached_property
+    def lang(self) -> str:
+        """Detected language of the mail
+
+        Returns:
+            str: Language code as returned by langdetect
+        """
+        import langdetect
+        return langdetect.detect(self.text)
+
+    @cached_property
+    def language(self) -> List[str]:
+        """LanguageTool code and nltk language name of the detected language
+
+        Returns:
+            List[str]: e.g. ["en-GB", "english"]
+        """
+        return languages.get(self.lang, ["en-GB", "english"])
+
+    @cached_property
+    def sentences(self) -> Tokens:
+        """Sentences of the mail (nltk punkt), as offsets into the text
+
+        Returns:
+            Tokens: Sentences
+        """
+        import nltk
+        tokenizer = nltk.data.load(f"tokenizers/punkt/{self.language[1]}.pickle")
+        return Tokens(self.text, tokenizer.span_tokenize(self.text))
+
+    @cached_property
+    def words(self) -> List[str]:
+        """Word tokens of the mail (nltk); same as nltk.word_tokenize but
+        reuses the sentences instead of splitting the text again
+
+        Returns:
+            List[str]: Word tokens
+        """
+        from nltk.tokenize import NLTKWordTokenizer
+        tokenizer = NLTKWordTokenizer()
+        return [word for sentence in self.sentences for word in tokenizer.tokenize(sentence)]
+
+    @cached_property
+    def blob(self) -> Any:
+        """TextBlob object of the mail; TextBlobDE for german mails
+
+        Returns:
+            TextBlob|TextBlobDE: Blob object
+        """
+        if self.lang == "de":
+            from textblob_de import TextBlobDE
+            return TextBlobDE(self.text)
+        from textblob import TextBlob
+        return TextBlob(self.text)
+
+
 class Content:
     """Class for handling mail content
     """
@@ -181,8 +388,7 @@ class Content:
             content (str): Mail content
         """
         self._content = self.format_content(content).lower()
-        self._words = self.extract_words()
-        self._sentences = self.extract_sentences()
+        self._ngrams: Dict[int, List[str]] = {}
 
     def format_content(self, content: str) -> str:
         """Format content and remove too many whitespaces
@@ -196,6 +402,15 @@ class Content:
         content = re.sub(r'[ \t]+', r' ', content)
         return content
 
+    @cached_property
+    def context(self) -> TextContext:
+        """Shared language/tokenization context of the mail
+
+        Returns:
+            TextContext: Lazily computed analysis context
+        """
+        return TextContext(self._content)
+
     def count(self, char: str) -> int:
         """Count occurrence of char in content
 
@@ -215,21 +430,68 @@ class Content:
         """
         return self._content.lower()
 
-    def extract_words(self) -> list:
-        """WIP
+    @cached_property
+    def words(self) -> Tokens:
+        """Words of the content; computed once on first access
+
+        Returns:
+            Tokens: Words
+        """
+        return self.extract_words()
+
+    @cached_property
+    def sentences(self) -> Tokens:
+        """Sentences of the content; computed once on first access
+
+        Returns:
+            Tokens: Sentences
+        """
+        return self.extract_sentences()
+
+    @cached_property
+    def iocs(self) -> Iocs:
+        """IOCs (coin addresses, IBANs, URLs, IPs, mail addresses) of the
+        content; scanned once on first access
+
+        Returns:
+            Iocs: IOCs with positions
+        """
+        return Iocs(self._content)
+
+    def ngrams(self, n: int) -> List[str]:
+        """Word n-grams of the content (like helper.dist_split(text, n));
+        computed once per n and shared by all callers
+
+        Args:
+            n (int): Number of words per n-gram
+
+        Returns:
+            List[str]: N-grams, words joined by a space
+        """
+        try:
+            return self._ngrams[n]
+        except KeyError:
+            pass
+        words = list(self.words)
+        grams = self._ngrams[n] = [" ".join(words[i:i + n]) for i in range(len(words) - n + 1)]
+        return grams
+
+    def extract_words(self) -> Tokens:
+        """Split content into words at whitespace and punctuation
+        (like helper.dist_split(text, 1))
 
         Returns:
-            list: WIP
+            Tokens: Words as offsets into the content
         """
-        return []
+        return Tokens(self._content, (m.span() for m in WORD.finditer(self._content)))
 
-    def extract_sentences(self) -> list:
-        """WIP
+    def extract_sentences(self) -> Tokens:
+        """Split content into sentences (nltk punkt of detected language)
 
         Returns:
-            list: WIP
+            Tokens: Sentences as offsets into the content
         """
-        return []
+        return self.context.sentences
 
     def startswith(self, start: str) -> bool:
         """Check if content startswith string
@@ -268,8 +530,8 @@ class Content:
             Any: Value
         """
         if key == "words":
-            return self._words
+            return self.words
         elif key == "sentences":
-            return self._sentences
+            return self.sentences
         else:
             raise Exception(f"Key '{key}' does not exist.")
@@ -0,0 +1,201 @@
+# Copyright 2022 Jakob Schaffarczyk
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compiled lookup structures for the lists in data/ with a versioned
+binary snapshot
+"""
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import json
+import os
+import pickle
+
+# Bump when the compiled structures change
+SNAPSHOT_VERSION = 2
+ROOT = Path(__file__).resolve().parent
+DATA_DIR = str(ROOT / "data")
+SNAPSHOT = str(ROOT / ".cache" / "data.pickle")
+DATA_FILES = [
+    "denylist.txt",
+    "allowlist.txt",
+    "spam.txt",
+    "evil.txt",
+    "blocked_subject.txt",
+    "mail_providers.txt",
+    "most_abused_tlds.txt",
+    "typosquatted.json",
+]
+
+
+class DomainSet:
+    """Set of case folded domains; with suffix matching a domain is
+    contained if it or one of its parent domains was added
+    (sub.example.com matches example.com). Lookups walk the labels from the
+    top level domain down, one hash lookup per label; kept flat (no nested
+    trie) so the snapshot loads fast
+    """
+    __slots__ = ("_domains", "suffixes")
+
+    def __init__(self, domains: Iterable[str] = (), suffixes: bool = True):
+        """Init domain set
+
+        Args:
+            domains (Iterable[str], optional): Domains. Defaults to ().
+            suffixes (bool, optional): Match subdomains of added domains too; False
+                for lists with public-suffix-like entries. Defaults to True.
+        """
+        self._domains = frozenset(
+            self._normalize(domain) for domain in domains if domain.strip())
+        self.suffixes = suffixes
+
+    @staticmethod
+    def _normalize(domain: str) -> str:
+        """internal: Case fold domain and strip dots/whitespace
+
+        Args:
+            domain (str): Domain
+
+        Returns:
+            str: Normalized domain
+        """
+        return domain.strip().strip(".").casefold()
+
+    def __contains__(self, domain: Any) -> bool:
+        """Check if domain (or, with suffix matching, one of its parent
+        domains) is in set; O(labels)
+
+        Args:
+            domain (Any): Domain
+
+        Returns:
+            bool: Whether domain matches
+        """
+        if not isinstance(domain, str) or not domain:
+            return False
+        domain = self._normalize(domain)
+        if not self.suffixes:
+            return domain in self._domains
+        pos = len(domain)
+        while pos >= 0:
+            pos = domain.rfind(".", 0, pos)
+            if domain[pos + 1:] in self._domains:
+                return True
+        return False
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over added domains
+
+        Returns:
+            Iterator[str]: Domains
+        """
+        return iter(self._domains)
+
+    def __len__(self) -> int:
+        """Number of added domains
+
+        Returns:
+            int: Number of domains
+        """
+        return len(self._domains)
+
+
+def _lines(data_dir: str, fname: str) -> List[str]:
+    """internal: Read non-empty lines of data file
+
+    Args:
+        data_dir (str): Data directory
+        fname (str): File name
+
+    Returns:
+        List[str]: Lines
+    """
+    with open(os.path.join(data_dir, fname), "r", encoding="utf-8") as f:
+        return [line for line in f.read().splitlines() if line.strip()]
+
+
+def compile_data(data_dir: str = DATA_DIR) -> Dict[str, Any]:
+    """Parse data files into lookup structures
+
+    Args:
+        data_dir (str, optional): Data directory. Defaults to data/ next to this module.
+
+    Returns:
+        Dict[str, Any]: Name of setting -> compiled data
+    """
+    with open(os.path.join(data_dir, "typosquatted.json"), "r", encoding="utf-8") as f:
+        typosq = json.load(f)
+    return {
+        "mail_denylist": DomainSet(_lines(data_dir, "denylist.txt")),
+        "mail_allowlist": DomainSet(_lines(data_dir, "allowlist.txt")),
+        # phrase order is kept for the buzzword matcher
+        "buzzwords_spam": _lines(data_dir, "spam.txt"),
+        "buzzwords_evil": _lines(data_dir, "evil.txt"),
+        "subject_blocklist": frozenset(
+            word.casefold() for word in _lines(data_dir, "blocked_subject.txt")),
+        # exact: the list holds public-suffix-like entries (pp.ua, co.cc, msk.ru)
+        "mail_providers": DomainSet(_lines(data_dir, "mail_providers.txt"), suffixes=False),
+        "abused_tlds": _lines(data_dir, "most_abused_tlds.txt"),
+        "typosq": typosq,
+    }
+
+
+def _stamp(data_dir: str) -> List[Tuple[str, int, int]]:
+    """internal: Size and modification time of all data files
+
+    Args:
+        data_dir (str): Data directory
+
+    Returns:
+        List[Tuple[str, int, int]]: (file, size, mtime) per data file
+    """
+    stamp = []
+    for fname in DATA_FILES:
+        stat = os.stat(os.path.join(data_dir, fname))
+        stamp.append((fname, stat.st_size, stat.st_mtime_ns))
+    return stamp
+
+
+def load(data_dir: str = DATA_DIR, snapshot: Optional[str] = SNAPSHOT) -> Dict[str, Any]:
+    """Load compiled data from snapshot; data files are parsed again (and
+    the snapshot rewritten) if they changed or the snapshot is missing,
+    outdated or broken
+
+    Args:
+        data_dir (str, optional): Data directory. Defaults to data/ next to this module.
+        snapshot (Optional[str], optional): Snapshot file; None disables it.
+            Defaults to .cache/data.pickle next to this module.
+
+    Returns:
+        Dict[str, Any]: Name of setting -> compiled data
+    """
+    stamp = _stamp(data_dir)
+    if snapshot is not None:
+        try:
+            with open(snapshot, "rb") as f:
+                version, saved, data = pickle.load(f)
+            if version == SNAPSHOT_VERSION and saved == stamp:
+                return data
+        except (OSError, EOFError, ValueError, TypeError, AttributeError,
+                pickle.UnpicklingError):
+            pass
+    data = compile_data(data_dir)
+    if snapshot is not None:
+        tmp = f"{snapshot}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(snapshot) or ".", exist_ok=True)
+            with open(tmp, "wb") as f:
+                pickle.dump((SNAPSHOT_VERSION, stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, snapshot)
+        except OSError:
+            pass
+    return data
@@ -0,0 +1,98 @@
+# Copyright 2022 Jakob Schaffarczyk
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Bounded (banded) Levenshtein distance
+"""
+from typing import Iterable, List, Optional
+
+
+def levenshtein(s1: str, s2: str, limit: Optional[int] = None) -> int:
+    """Levenshtein distance; only the diagonal band of width limit is
+    computed (Ukkonen) and the calculation stops as soon as every cell
+    of a row exceeds limit
+    :param s1: first string
+    :param s2: second string
+    :param limit: maximum distance of interest (None: unbounded)
+    :return: distance, limit + 1 if the distance exceeds limit
+    """
+    if s1 == s2:
+        return 0
+    # common prefix and suffix do not change the distance
+    len1, len2 = len(s1), len(s2)
+    pre = 0
+    while pre < len1 and pre < len2 and s1[pre] == s2[pre]:
+        pre += 1
+    suf = 0
+    while suf < len1 - pre and suf < len2 - pre and s1[len1 - 1 - suf] == s2[len2 - 1 - suf]:
+        suf += 1
+    s1 = s1[pre:len1 - suf]
+    s2 = s2[pre:len2 - suf]
+    if len(s1) > len(s2):
+        s1, s2 = s2, s1
+    len1, len2 = len(s1), len(s2)
+    if limit is None or limit > len2:
+        limit = len2
+    over = limit + 1
+    if len2 - len1 > limit:
+        return over
+    if not len1:
+        return len2
+
+    prev = [j if j <= limit else over for j in range(len2 + 1)]
+    cur = [over] * (len2 + 1)
+    for i in range(1, len1 + 1):
+        low = max(1, i - limit)
+        high = min(len2, i + limit)
+        cur[low - 1] = i if low == 1 else over
+        char = s1[i - 1]
+        row_min = cur[low - 1]
+        for j in range(low, high + 1):
+            val = prev[j - 1] + (char != s2[j - 1])
+            if cur[j - 1] + 1 < val:
+                val = cur[j - 1] + 1
+            if prev[j] + 1 < val:
+                val = prev[j] + 1
+            cur[j] = val
+            if val < row_min:
+                row_min = val
+        if high < len2:
+            cur[high + 1] = over
+        if row_min > limit:
+            return over
+        prev, cur = cur, prev
+    return min(prev[len2], over)
+
+
+def within(s1: str, s2: str, limit: int) -> bool:
+    """Check if Levenshtein distance is at most limit
+    :param s1: first string
+    :param s2: second string
+    :param limit: maximum distance
+    :return: whether distance <= limit
+    """
+    return levenshtein(s1, s2, limit) <= limit
+
+
+def levenshtein_many(query: str, candidates: Iterable[str], limit: Optional[int] = None) -> List[int]:
+    """Levenshtein distance of one string to many; candidates whose
+    length alone rules them out are not compared at all
+    :param query: string to compare
+    :param candidates: strings to compare with
+    :param limit: maximum distance of interest (None: unbounded)
+    :return: distance per candidate, limit + 1 if it exceeds limit
+    """
+    if limit is None:
+        return [levenshtein(query, cand) for cand in candidates]
+    size = len(query)
+    return [levenshtein(query, cand, limit) if abs(len(cand) - size) <= limit else limit + 1
+            for cand in candidates]
@@ -11,3446 +11,322 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Contains list of emojis needed for subject anomaly analysis
+"""Emoji code point ranges needed for subject anomaly analysis;
+generated by scripts/emojis_to_list.py from data/emojis.txt, do not edit
 """
-EMOJIS = [
-    8596,
-    8597,
-    8598,
-    8599,
-    8600,
-    8601,
-    8617,
-    8618,
-    8986,
-    8987,
-    9193,
-    9194,
-    9195,
-    9196,
-    9197,
-    9198,
-    9201,
-    9202,
-    9208,
-    9209,
-    9210,
-    9642,
-    9643,
-    9723,
-    9724,
-    9725,
-    9726,
-    9728,
-    9729,
-    9730,
-    9731,
-    9735,
-    9736,
-    9737,
-    9738,
-    9739,
-    9740,
-    9741,
-    9743,
-    9744,
-    9748,
-    9749,
-    9750,
-    9751,
-    9753,
-    9754,
-    9755,
-    9756,
-    9758,
-    9759,
-    9762,
-    9763,
-    9764,
-    9765,
-    9767,
-    9768,
-    9769,
-    9771,
-    9772,
-    9773,
-    9776,
-    9777,
-    9778,
-    9779,
-    9780,
-    9781,
-    9782,
-    9783,
-    9784,
-    9785,
-    9787,
-    9788,
-    9789,
-    9790,
-    9791,
-    9795,
-    9796,
-    9797,
-    9798,
-    9799,
-    9800,
-    9801,
-    9802,
-    9803,
-    9804,
-    9805,
-    9806,
-    9807,
-    9808,
-    9809,
-    9810,
-    9811,
-    9812,
-    9813,
-    9814,
-    9815,
-    9816,
-    9817,
-    9818,
-    9819,
-    9820,
-    9821,
-    9822,
-    9825,
-    9826,
-    9829,
-    9830,
-    9833,
-    9834,
-    9835,
-    9836,
-    9837,
-    9838,
-    9839,
-    9840,
-    9841,
-    9842,
-    9843,
-    9844,
-    9845,
-    9846,
-    9847,
-    9848,
-    9849,
-    9850,
-    9852,
-    9853,
-    9856,
-    9857,
-    9858,
-    9859,
-    9860,
-    9861,
-    9872,
-    9873,
-    9878,
-    9879,
-    9883,
-    9884,
-    9885,
-    9886,
-    9887,
-    9888,
-    9889,
-    9890,
-    9891,
-    9892,
-    9893,
-    9894,
-    9896,
-    9897,
-    9898,
-    9899,
-    9900,
-    9901,
-    9902,
-    9903,
-    9904,
-    9905,
-    9906,
-    9907,
-    9908,
-    9909,
-    9910,
-    9911,
-    9912,
-    9913,
-    9914,
-    9915,
-    9916,
-    9917,
-    9918,
-    9919,
-    9920,
-    9921,
-    9922,
-    9923,
-    9924,
-    9925,
-    9926,
-    9927,
-    9929,
-    9930,
-    9931,
-    9932,
-    9933,
-    9941,
-    9942,
-    9943,
-    9944,
-    9945,
-    9946,
-    9947,
-    9948,
-    9949,
-    9950,
-    9951,
-    9952,
-    9953,
-    9954,
-    9955,
-    9956,
-    9957,
-    9958,
-    9959,
-    9960,
-    9963,
-    9964,
-    9965,
-    9966,
-    9967,
-    9968,
-    9969,
-    9970,
-    9971,
-    9975,
-    9976,
-    9977,
-    9979,
-    9980,
-    9982,
-    9983,
-    9984,
-    9985,
-    9987,
-    9988,
-    9992,
-    9993,
-    9994,
-    9995,
-    9996,
-    10000,
-    10001,
-    10035,
-    10036,
-    10067,
-    10068,
-    10069,
-    10085,
-    10086,
-    10087,
-    10133,
-    10134,
-    10135,
-    10548,
-    10549,
-    11013,
-    11014,
-    11015,
-    11035,
-    11036,
-    126976,
-    126977,
-    126978,
-    126979,
-    126981,
-    126982,
-    126983,
-    126984,
-    126985,
-    126986,
-    126987,
-    126988,
-    126989,
-    126990,
-    126991,
-    126992,
-    126993,
-    126994,
-    126995,
-    126996,
-    126997,
-    126998,
-    126999,
-    127000,
-    127001,
-    127002,
-    127003,
-    127004,
-    127005,
-    127006,
-    127007,
-    127008,
-    127009,
-    127010,
-    127011,
-    127012,
-    127013,
-    127014,
-    127015,
-    127016,
-    127017,
-    127018,
-    127019,
-    127020,
-    127021,
-    127022,
-    127023,
-    127024,
-    127025,
-    127026,
-    127027,
-    127028,
-    127029,
-    127030,
-    127031,
-    127032,
-    127033,
-    127034,
-    127035,
-    127036,
-    127037,
-    127038,
-    127039,
-    127040,
-    127041,
-    127042,
-    127043,
-    127044,
-    127045,
-    127046,
-    127047,
-    127048,
-    127049,
-    127050,
-    127051,
-    127052,
-    127053,
-    127054,
-    127055,
-    127056,
-    127057,
-    127058,
-    127059,
-    127060,
-    127061,
-    127062,
-    127063,
-    127064,
-    127065,
-    127066,
-    127067,
-    127068,
-    127069,
-    127070,
-    127071,
-    127072,
-    127073,
-    127074,
-    127075,
-    127076,
-    127077,
-    127078,
-    127079,
-    127080,
-    127081,
-    127082,
-    127083,
-    127084,
-    127085,
-    127086,
-    127087,
-    127088,
-    127089,
-    127090,
-    127091,
-    127092,
-    127093,
-    127094,
-    127095,
-    127096,
-    127097,
-    127098,
-    127099,
-    127100,
-    127101,
-    127102,
-    127103,
-    127104,
-    127105,
-    127106,
-    127107,
-    127108,
-    127109,
-    127110,
-    127111,
-    127112,
-    127113,
-    127114,
-    127115,
-    127116,
-    127117,
-    127118,
-    127119,
-    127120,
-    127121,
-    127122,
-    127123,
-    127124,
-    127125,
-    127126,
-    127127,
-    127128,
-    127129,
-    127130,
-    127131,
-    127132,
-    127133,
-    127134,
-    127135,
-    127136,
-    127137,
-    127138,
-    127139,
-    127140,
-    127141,
-    127142,
-    127143,
-    127144,
-    127145,
-    127146,
-    127147,
-    127148,
-    127149,
-    127150,
-    127151,
-    127152,
-    127153,
-    127154,
-    127155,
-    127156,
-    127157,
-    127158,
-    127159,
-    127160,
-    127161,
-    127162,
-    127163,
-    127164,
-    127165,
-    127166,
-    127167,
-    127168,
-    127169,
-    127170,
-    127171,
-    127172,
-    127173,
-    127174,
-    127175,
-    127176,
-    127177,
-    127178,
-    127179,
-    127180,
-    127181,
-    127182,
-    127184,
-    127185,
-    127186,
-    127187,
-    127188,
-    127189,
-    127190,
-    127191,
-    127192,
-    127193,
-    127194,
-    127195,
-    127196,
-    127197,
-    127198,
-    127199,
-    127200,
-    127201,
-    127202,
-    127203,
-    127204,
-    127205,
-    127206,
-    127207,
-    127208,
-    127209,
-    127210,
-    127211,
-    127212,
-    127213,
-    127214,
-    127215,
-    127216,
-    127217,
-    127218,
-    127219,
-    127220,
-    127221,
-    127222,
-    127223,
-    127224,
-    127225,
-    127226,
-    127227,
-    127228,
-    127229,
-    127230,
-    127231,
-    127245,
-    127246,
-    127247,
-    127340,
-    127341,
-    127342,
-    127343,
-    127344,
-    127345,
-    127358,
-    127359,
-    127377,
-    127378,
-    127379,
-    127380,
-    127381,
-    127382,
-    127383,
-    127384,
-    127385,
-    127386,
-    127405,
-    127406,
-    127407,
-    127408,
-    127409,
-    127410,
-    127411,
-    127412,
-    127413,
-    127414,
-    127415,
-    127416,
-    127417,
-    127418,
-    127419,
-    127420,
-    127421,
-    127422,
-    127423,
-    127424,
-    127425,
-    127426,
-    127427,
-    127428,
-    127429,
-    127430,
-    127431,
-    127432,
-    127433,
-    127434,
-    127435,
-    127436,
-    127437,
-    127438,
-    127439,
-    127440,
-    127441,
-    127442,
-    127443,
-    127444,
-    127445,
-    127446,
-    127447,
-    127448,
-    127449,
-    127450,
-    127451,
-    127452,
-    127453,
-    127454,
-    127455,
-    127456,
-    127457,
-    127458,
-    127459,
-    127460,
-    127461,
-    127462,
-    127463,
-    127464,
-    127465,
-    127466,
-    127467,
-    127468,
-    127469,
-    127470,
-    127471,
-    127472,
-    127473,
-    127474,
-    127475,
-    127476,
-    127477,
-    127478,
-    127479,
-    127480,
-    127481,
-    127482,
-    127483,
-    127484,
-    127485,
-    127486,
-    127487,
-    127489,
-    127490,
-    127491,
-    127492,
-    127493,
-    127494,
-    127495,
-    127496,
-    127497,
-    127498,
-    127499,
-    127500,
-    127501,
-    127502,
-    127503,
-    127538,
-    127539,
-    127540,
-    127541,
-    127542,
-    127543,
-    127544,
-    127545,
-    127546,
-    127548,
-    127549,
-    127550,
-    127551,
-    127561,
-    127562,
-    127563,
-    127564,
-    127565,
-    127566,
-    127567,
-    127568,
-    127569,
-    127570,
-    127571,
-    127572,
-    127573,
-    127574,
-    127575,
-    127576,
-    127577,
-    127578,
-    127579,
-    127580,
-    127581,
-    127582,
-    127583,
-    127584,
-    127585,
-    127586,
-    127587,
-    127588,
-    127589,
-    127590,
-    127591,
-    127592,
-    127593,
-    127594,
-    127595,
-    127596,
-    127597,
-    127598,
-    127599,
-    127600,
-    127601,
-    127602,
-    127603,
-    127604,
-    127605,
-    127606,
-    127607,
-    127608,
-    127609,
-    127610,
-    127611,
-    127612,
-    127613,
-    127614,
-    127615,
-    127616,
-    127617,
-    127618,
-    127619,
-    127620,
-    127621,
-    127622,
-    127623,
-    127624,
-    127625,
-    127626,
-    127627,
-    127628,
-    127629,
-    127630,
-    127631,
-    127632,
-    127633,
-    127634,
-    127635,
-    127636,
-    127637,
-    127638,
-    127639,
-    127640,
-    127641,
-    127642,
-    127643,
-    127644,
-    127645,
-    127646,
-    127647,
-    127648,
-    127649,
-    127650,
-    127651,
-    127652,
-    127653,
-    127654,
-    127655,
-    127656,
-    127657,
-    127658,
-    127659,
-    127660,
-    127661,
-    127662,
-    127663,
-    127664,
-    127665,
-    127666,
-    127667,
-    127668,
-    127669,
-    127670,
-    127671,
-    127672,
-    127673,
-    127674,
-    127675,
-    127676,
-    127677,
-    127678,
-    127679,
-    127680,
-    127681,
-    127682,
-    127683,
-    127684,
-    127685,
-    127686,
-    127687,
-    127688,
-    127689,
-    127690,
-    127691,
-    127692,
-    127693,
-    127694,
-    127695,
-    127696,
-    127697,
-    127698,
-    127699,
-    127700,
-    127701,
-    127702,
-    127703,
-    127704,
-    127705,
-    127706,
-    127707,
-    127708,
-    127709,
-    127710,
-    127711,
-    127712,
-    127713,
-    127714,
-    127715,
-    127716,
-    127717,
-    127718,
-    127719,
-    127720,
-    127721,
-    127722,
-    127723,
-    127724,
-    127725,
-    127726,
-    127727,
-    127728,
-    127729,
-    127730,
-    127731,
-    127732,
-    127733,
-    127734,
-    127735,
-    127736,
-    127737,
-    127738,
-    127739,
-    127740,
-    127741,
-    127742,
-    127743,
-    127744,
-    127745,
-    127746,
-    127747,
-    127748,
-    127749,
-    127750,
-    127751,
-    127752,
-    127753,
-    127754,
-    127755,
-    127756,
-    127757,
-    127758,
-    127763,
-    127764,
-    127765,
-    127766,
-    127767,
-    127768,
-    127773,
-    127774,
-    127775,
-    127776,
-    127778,
-    127779,
-    127780,
-    127781,
-    127782,
-    127783,
-    127784,
-    127785,
-    127786,
-    127787,
-    127788,
-    127789,
-    127790,
-    127791,
-    127792,
-    127793,
-    127794,
-    127795,
-    127796,
-    127797,
-    127799,
-    127800,
-    127801,
-    127802,
-    127803,
-    127804,
-    127805,
-    127806,
-    127807,
-    127808,
-    127809,
-    127810,
-    127811,
-    127812,
-    127813,
-    127814,
-    127815,
-    127816,
-    127817,
-    127818,
-    127820,
-    127821,
-    127822,
-    127823,
-    127825,
-    127826,
-    127827,
-    127828,
-    127829,
-    127830,
-    127831,
-    127832,
-    127833,
-    127834,
-    127835,
-    127836,
-    127837,
-    127838,
-    127839,
-    127840,
-    127841,
-    127842,
-    127843,
-    127844,
-    127845,
-    127846,
-    127847,
-    127848,
-    127849,
-    127850,
-    127851,
-    127852,
-    127853,
-    127854,
-    127855,
-    127856,
-    127857,
-    127858,
-    127859,
-    127860,
-    127861,
-    127862,
-    127863,
-    127864,
-    127865,
-    127866,
-    127867,
-    127870,
-    127871,
-    127872,
-    127873,
-    127874,
-    127875,
-    127876,
-    127877,
-    127878,
-    127879,
-    127880,
-    127881,
-    127882,
-    127883,
-    127884,
-    127885,
-    127886,
-    127887,
-    127888,
-    127889,
-    127890,
-    127891,
-    127892,
-    127893,
-    127894,
-    127895,
-    127897,
-    127898,
-    127899,
-    127900,
-    127901,
-    127902,
-    127903,
-    127904,
-    127905,
-    127906,
-    127907,
-    127908,
-    127909,
-    127910,
-    127911,
-    127912,
-    127913,
-    127914,
-    127915,
-    127916,
-    127917,
-    127918,
-    127919,
-    127920,
-    127921,
-    127922,
-    127923,
-    127924,
-    127925,
-    127926,
-    127927,
-    127928,
-    127929,
-    127930,
-    127931,
-    127932,
-    127933,
-    127934,
-    127935,
-    127936,
-    127937,
-    127938,
-    127939,
-    127940,
-    127947,
-    127948,
-    127949,
-    127950,
-    127951,
-    127952,
-    127953,
-    127954,
-    127955,
-    127956,
-    127957,
-    127958,
-    127959,
-    127960,
-    127961,
-    127962,
-    127963,
-    127964,
-    127965,
-    127966,
-    127967,
-    127968,
-    127969,
-    127970,
-    127971,
-    127973,
-    127974,
-    127975,
-    127976,
-    127977,
-    127978,
-    127979,
-    127980,
-    127981,
-    127982,
-    127983,
-    127984,
-    127985,
-    127986,
-    127992,
-    127993,
-    127994,
-    127995,
-    127996,
-    127997,
-    127998,
-    127999,
-    128000,
-    128001,
-    128002,
-    128003,
-    128004,
-    128005,
-    128006,
-    128007,
-    128009,
-    128010,
-    128011,
-    128012,
-    128013,
-    128014,
-    128015,
-    128016,
-    128017,
-    128018,
-    128023,
-    128024,
-    128025,
-    128026,
-    128027,
-    128028,
-    128029,
-    128030,
-    128031,
-    128032,
-    128033,
-    128034,
-    128035,
-    128036,
-    128037,
-    128038,
-    128039,
-    128040,
-    128041,
-    128043,
-    128044,
-    128045,
-    128046,
-    128047,
-    128048,
-    128049,
-    128050,
-    128051,
-    128052,
-    128053,
-    128054,
-    128055,
-    128056,
-    128057,
-    128058,
-    128059,
-    128060,
-    128061,
-    128062,
-    128066,
-    128067,
-    128068,
-    128069,
-    128070,
-    128071,
-    128072,
-    128073,
-    128074,
-    128075,
-    128076,
-    128077,
-    128078,
-    128079,
-    128080,
-    128081,
-    128082,
-    128083,
-    128084,
-    128085,
-    128086,
-    128087,
-    128088,
-    128089,
-    128090,
-    128091,
-    128092,
-    128093,
-    128094,
-    128095,
-    128096,
-    128097,
-    128098,
-    128099,
-    128100,
-    128102,
-    128103,
-    128104,
-    128105,
-    128106,
-    128107,
-    128108,
-    128109,
-    128110,
-    128111,
-    128112,
-    128113,
-    128114,
-    128115,
-    128116,
-    128117,
-    128118,
-    128119,
-    128120,
-    128121,
-    128122,
-    128123,
-    128124,
-    128125,
-    128126,
-    128127,
-    128128,
-    128129,
-    128130,
-    128131,
-    128132,
-    128133,
-    128134,
-    128135,
-    128136,
-    128137,
-    128138,
-    128139,
-    128140,
-    128141,
-    128142,
-    128143,
-    128144,
-    128145,
-    128146,
-    128147,
-    128148,
-    128149,
-    128150,
-    128151,
-    128152,
-    128153,
-    128154,
-    128155,
-    128156,
-    128157,
-    128158,
-    128159,
-    128160,
-    128161,
-    128162,
-    128163,
-    128164,
-    128165,
-    128166,
-    128167,
-    128168,
-    128169,
-    128170,
-    128171,
-    128172,
-    128174,
-    128175,
-    128176,
-    128177,
-    128178,
-    128179,
-    128180,
-    128181,
-    128182,
-    128183,
-    128184,
-    128185,
-    128186,
-    128187,
-    128188,
-    128189,
-    128190,
-    128191,
-    128192,
-    128193,
-    128194,
-    128195,
-    128196,
-    128197,
-    128198,
-    128199,
-    128200,
-    128201,
-    128202,
-    128203,
-    128204,
-    128205,
-    128206,
-    128207,
-    128208,
-    128209,
-    128210,
-    128211,
-    128212,
-    128213,
-    128214,
-    128215,
-    128216,
-    128217,
-    128218,
-    128219,
-    128220,
-    128221,
-    128222,
-    128223,
-    128224,
-    128225,
-    128226,
-    128227,
-    128228,
-    128229,
-    128230,
-    128231,
-    128232,
-    128233,
-    128234,
-    128235,
-    128236,
-    128237,
-    128240,
-    128241,
-    128242,
-    128243,
-    128244,
-    128246,
-    128247,
-    128249,
-    128250,
-    128251,
-    128252,
-    128255,
-    128256,
-    128257,
-    128258,
-    128260,
-    128261,
-    128262,
-    128263,
-    128266,
-    128267,
-    128268,
-    128269,
-    128270,
-    128271,
-    128272,
-    128273,
-    128274,
-    128275,
-    128276,
-    128278,
-    128279,
-    128280,
-    128281,
-    128282,
-    128283,
-    128284,
-    128285,
-    128286,
-    128287,
-    128288,
-    128289,
-    128290,
-    128291,
-    128292,
-    128293,
-    128294,
-    128295,
-    128296,
-    128297,
-    128298,
-    128299,
-    128300,
-    128301,
-    128302,
-    128303,
-    128304,
-    128305,
-    128306,
-    128307,
-    128308,
-    128309,
-    128310,
-    128311,
-    128312,
-    128313,
-    128314,
-    128315,
-    128316,
-    128317,
-    128326,
-    128327,
-    128328,
-    128329,
-    128330,
-    128331,
-    128332,
-    128333,
-    128334,
-    128336,
-    128337,
-    128338,
-    128339,
-    128340,
-    128341,
-    128342,
-    128343,
-    128344,
-    128345,
-    128346,
-    128347,
-    128348,
-    128349,
-    128350,
-    128351,
-    128352,
-    128353,
-    128354,
-    128355,
-    128356,
-    128357,
-    128358,
-    128359,
-    128360,
-    128361,
-    128362,
-    128363,
-    128364,
-    128365,
-    128366,
-    128367,
-    128368,
-    128369,
-    128370,
-    128371,
-    128372,
-    128373,
-    128374,
-    128375,
-    128376,
-    128377,
-    128379,
-    128380,
-    128381,
-    128382,
-    128383,
-    128384,
-    128385,
-    128386,
-    128387,
-    128388,
-    128389,
-    128390,
-    128392,
-    128393,
-    128394,
-    128395,
-    128396,
-    128397,
-    128398,
-    128399,
-    128401,
-    128402,
-    128403,
-    128404,
-    128405,
-    128406,
-    128407,
-    128408,
-    128409,
-    128410,
-    128411,
-    128412,
-    128413,
-    128414,
-    128415,
-    128416,
-    128417,
-    128418,
-    128419,
-    128422,
-    128423,
-    128425,
-    128426,
-    128427,
-    128428,
-    128429,
-    128430,
-    128431,
-    128432,
-    128433,
-    128434,
-    128435,
-    128436,
-    128437,
-    128438,
-    128439,
-    128440,
-    128441,
-    128442,
-    128443,
-    128445,
-    128446,
-    128447,
-    128448,
-    128449,
-    128450,
-    128451,
-    128452,
-    128453,
-    128454,
-    128455,
-    128456,
-    128457,
-    128458,
-    128459,
-    128460,
-    128461,
-    128462,
-    128463,
-    128464,
-    128465,
-    128466,
-    128467,
-    128468,
-    128469,
-    128470,
-    128471,
-    128472,
-    128473,
-    128474,
-    128475,
-    128476,
-    128477,
-    128478,
-    128479,
-    128480,
-    128484,
-    128485,
-    128486,
-    128487,
-    128489,
-    128490,
-    128491,
-    128492,
-    128493,
-    128494,
-    128496,
-    128497,
-    128498,
-    128500,
-    128501,
-    128502,
-    128503,
-    128504,
-    128505,
-    128507,
-    128508,
-    128509,
-    128510,
-    128511,
-    128513,
-    128514,
-    128515,
-    128516,
-    128517,
-    128518,
-    128519,
-    128520,
-    128521,
-    128522,
-    128523,
-    128524,
-    128525,
-    128530,
-    128531,
-    128532,
-    128540,
-    128541,
-    128542,
-    128544,
-    128545,
-    128546,
-    128547,
-    128548,
-    128549,
-    128550,
-    128551,
-    128552,
-    128553,
-    128554,
-    128555,
-    128558,
-    128559,
-    128560,
-    128561,
-    128562,
-    128563,
-    128567,
-    128568,
-    128569,
-    128570,
-    128571,
-    128572,
-    128573,
-    128574,
-    128575,
-    128576,
-    128577,
-    128578,
-    128579,
-    128580,
-    128581,
-    128582,
-    128583,
-    128584,
-    128585,
-    128586,
-    128587,
-    128588,
-    128589,
-    128590,
-    128591,
-    128641,
-    128642,
-    128643,
-    128644,
-    128645,
-    128650,
-    128651,
-    128657,
-    128658,
-    128659,
-    128665,
-    128666,
-    128667,
-    128668,
-    128669,
-    128670,
-    128671,
-    128672,
-    128673,
-    128676,
-    128677,
-    128679,
-    128680,
-    128681,
-    128682,
-    128683,
-    128684,
-    128685,
-    128686,
-    128687,
-    128688,
-    128689,
-    128691,
-    128692,
-    128693,
-    128695,
-    128696,
-    128697,
-    128698,
-    128699,
-    128700,
-    128701,
-    128702,
-    128705,
-    128706,
-    128707,
-    128708,
-    128709,
-    128710,
-    128711,
-    128712,
-    128713,
-    128714,
-    128717,
-    128718,
-    128719,
-    128721,
-    128722,
-    128723,
-    128724,
-    128726,
-    128727,
-    128728,
-    128729,
-    128730,
-    128731,
-    128732,
-    128733,
-    128734,
-    128735,
-    128736,
-    128737,
-    128738,
-    128739,
-    128740,
-    128741,
-    128742,
-    128743,
-    128744,
-    128747,
-    128748,
-    128749,
-    128750,
-    128751,
-    128753,
-    128754,
-    128756,
-    128757,
-    128758,
-    128759,
-    128760,
-    128763,
-    128764,
-    128765,
-    128766,
-    128767,
-    128884,
-    128885,
-    128886,
-    128887,
-    128888,
-    128889,
-    128890,
-    128891,
-    128892,
-    128893,
-    128894,
-    128895,
-    128981,
-    128982,
-    128983,
-    128984,
-    128985,
-    128986,
-    128987,
-    128988,
-    128989,
-    128990,
-    128991,
-    128992,
-    128993,
-    128994,
-    128995,
-    128996,
-    128997,
-    128998,
-    128999,
-    129000,
-    129001,
-    129002,
-    129003,
-    129004,
-    129005,
-    129006,
-    129007,
-    129009,
-    129010,
-    129011,
-    129012,
-    129013,
-    129014,
-    129015,
-    129016,
-    129017,
-    129018,
-    129019,
-    129020,
-    129021,
-    129022,
-    129023,
-    129036,
-    129037,
-    129038,
-    129039,
-    129096,
-    129097,
-    129098,
-    129099,
-    129100,
-    129101,
-    129102,
-    129103,
-    129114,
-    129115,
-    129116,
-    129117,
-    129118,
-    129119,
-    129160,
-    129161,
-    129162,
-    129163,
-    129164,
-    129165,
-    129166,
-    129167,
-    129198,
-    129199,
-    129200,
-    129201,
-    129202,
-    129203,
-    129204,
-    129205,
-    129206,
-    129207,
-    129208,
-    129209,
-    129210,
-    129211,
-    129212,
-    129213,
-    129214,
-    129215,
-    129216,
-    129217,
-    129218,
-    129219,
-    129220,
-    129221,
-    129222,
-    129223,
-    129224,
-    129225,
-    129226,
-    129227,
-    129228,
-    129229,
-    129230,
-    129231,
-    129232,
-    129233,
-    129234,
-    129235,
-    129236,
-    129237,
-    129238,
-    129239,
-    129240,
-    129241,
-    129242,
-    129243,
-    129244,
-    129245,
-    129246,
-    129247,
-    129248,
-    129249,
-    129250,
-    129251,
-    129252,
-    129253,
-    129254,
-    129255,
-    129256,
-    129257,
-    129258,
-    129259,
-    129260,
-    129261,
-    129262,
-    129263,
-    129264,
-    129265,
-    129266,
-    129267,
-    129268,
-    129269,
-    129270,
-    129271,
-    129272,
-    129273,
-    129274,
-    129275,
-    129276,
-    129277,
-    129278,
-    129279,
-    129293,
-    129294,
-    129295,
-    129296,
-    129297,
-    129298,
-    129299,
-    129300,
-    129301,
-    129302,
-    129303,
-    129304,
-    129305,
-    129306,
-    129307,
-    129308,
-    129309,
-    129310,
-    129312,
-    129313,
-    129314,
-    129315,
-    129316,
-    129317,
-    129318,
-    129319,
-    129320,
-    129321,
-    129322,
-    129323,
-    129324,
-    129325,
-    129326,
-    129327,
-    129329,
-    129330,
-    129331,
-    129332,
-    129333,
-    129334,
-    129335,
-    129336,
-    129337,
-    129338,
-    129340,
-    129341,
-    129342,
-    129344,
-    129345,
-    129346,
-    129347,
-    129348,
-    129349,
-    129351,
-    129352,
-    129353,
-    129354,
-    129355,
-    129357,
-    129358,
-    129359,
-    129360,
-    129361,
-    129362,
-    129363,
-    129364,
-    129365,
-    129366,
-    129367,
-    129368,
-    129369,
-    129370,
-    129371,
-    129372,
-    129373,
-    129374,
-    129375,
-    129376,
-    129377,
-    129378,
-    129379,
-    129380,
-    129381,
-    129382,
-    129383,
-    129384,
-    129385,
-    129386,
-    129387,
-    129388,
-    129389,
-    129390,
-    129391,
-    129392,
-    129395,
-    129396,
-    129397,
-    129398,
-    129399,
-    129400,
-    129404,
-    129405,
-    129406,
-    129407,
-    129408,
-    129409,
-    129410,
-    129411,
-    129412,
-    129413,
-    129414,
-    129415,
-    129416,
-    129417,
-    129418,
-    129419,
-    129420,
-    129421,
-    129422,
-    129423,
-    129424,
-    129425,
-    129426,
-    129427,
-    129428,
-    129429,
-    129430,
-    129431,
-    129432,
-    129433,
-    129434,
-    129435,
-    129436,
-    129437,
-    129438,
-    129439,
-    129440,
-    129441,
-    129442,
-    129443,
-    129444,
-    129445,
-    129446,
-    129447,
-    129448,
-    129449,
-    129450,
-    129451,
-    129452,
-    129453,
-    129454,
-    129455,
-    129456,
-    129457,
-    129458,
-    129459,
-    129460,
-    129461,
-    129462,
-    129463,
-    129464,
-    129465,
-    129466,
-    129467,
-    129468,
-    129469,
-    129470,
-    129471,
-    129473,
-    129474,
-    129475,
-    129476,
-    129477,
-    129478,
-    129479,
-    129480,
-    129481,
-    129482,
-    129485,
-    129486,
-    129487,
-    129488,
-    129489,
-    129490,
-    129491,
-    129492,
-    129493,
-    129494,
-    129495,
-    129496,
-    129497,
-    129498,
-    129499,
-    129500,
-    129501,
-    129502,
-    129503,
-    129504,
-    129505,
-    129506,
-    129507,
-    129508,
-    129509,
-    129510,
-    129511,
-    129512,
-    129513,
-    129514,
-    129515,
-    129516,
-    129517,
-    129518,
-    129519,
-    129520,
-    129521,
-    129522,
-    129523,
-    129524,
-    129525,
-    129526,
-    129527,
-    129528,
-    129529,
-    129530,
-    129531,
-    129532,
-    129533,
-    129534,
-    129535,
-    129536,
-    129537,
-    129538,
-    129539,
-    129540,
-    129541,
-    129542,
-    129543,
-    129544,
-    129545,
-    129546,
-    129547,
-    129548,
-    129549,
-    129550,
-    129551,
-    129552,
-    129553,
-    129554,
-    129555,
-    129556,
-    129557,
-    129558,
-    129559,
-    129560,
-    129561,
-    129562,
-    129563,
-    129564,
-    129565,
-    129566,
-    129567,
-    129568,
-    129569,
-    129570,
-    129571,
-    129572,
-    129573,
-    129574,
-    129575,
-    129576,
-    129577,
-    129578,
-    129579,
-    129580,
-    129581,
-    129582,
-    129583,
-    129584,
-    129585,
-    129586,
-    129587,
-    129588,
-    129589,
-    129590,
-    129591,
-    129592,
-    129593,
-    129594,
-    129595,
-    129596,
-    129597,
-    129598,
-    129599,
-    129600,
-    129601,
-    129602,
-    129603,
-    129604,
-    129605,
-    129606,
-    129607,
-    129608,
-    129609,
-    129610,
-    129611,
-    129612,
-    129613,
-    129614,
-    129615,
-    129616,
-    129617,
-    129618,
-    129619,
-    129620,
-    129621,
-    129622,
-    129623,
-    129624,
-    129625,
-    129626,
-    129627,
-    129628,
-    129629,
-    129630,
-    129631,
-    129632,
-    129633,
-    129634,
-    129635,
-    129636,
-    129637,
-    129638,
-    129639,
-    129640,
-    129641,
-    129642,
-    129643,
-    129644,
-    129645,
-    129646,
-    129647,
-    129648,
-    129649,
-    129650,
-    129651,
-    129653,
-    129654,
-    129655,
-    129656,
-    129657,
-    129658,
-    129659,
-    129660,
-    129661,
-    129662,
-    129663,
-    129664,
-    129665,
-    129666,
-    129667,
-    129668,
-    129669,
-    129670,
-    129671,
-    129672,
-    129673,
-    129674,
-    129675,
-    129676,
-    129677,
-    129678,
-    129679,
-    129680,
-    129681,
-    129682,
-    129683,
-    129684,
-    129685,
-    129686,
-    129687,
-    129688,
-    129689,
-    129690,
-    129691,
-    129692,
-    129693,
-    129694,
-    129695,
-    129696,
-    129697,
-    129698,
-    129699,
-    129700,
-    129701,
-    129702,
-    129703,
-    129704,
-    129705,
-    129706,
-    129707,
-    129708,
-    129709,
-    129710,
-    129711,
-    129712,
-    129713,
-    129714,
-    129715,
-    129716,
-    129717,
-    129718,
-    129719,
-    129720,
-    129721,
-    129722,
-    129723,
-    129724,
-    129725,
-    129726,
-    129727,
-    129728,
-    129729,
-    129730,
-    129731,
-    129732,
-    129733,
-    129734,
-    129735,
-    129736,
-    129737,
-    129738,
-    129739,
-    129740,
-    129741,
-    129742,
-    129743,
-    129744,
-    129745,
-    129746,
-    129747,
-    129748,
-    129749,
-    129750,
-    129751,
-    129752,
-    129753,
-    129754,
-    129755,
-    129756,
-    129757,
-    129758,
-    129759,
-    129760,
-    129761,
-    129762,
-    129763,
-    129764,
-    129765,
-    129766,
-    129767,
-    129768,
-    129769,
-    129770,
-    129771,
-    129772,
-    129773,
-    129774,
-    129775,
-    129776,
-    129777,
-    129778,
-    129779,
-    129780,
-    129781,
-    129782,
-    129783,
-    129784,
-    129785,
-    129786,
-    129787,
-    129788,
-    129789,
-    129790,
-    129791,
-    130048,
-    130049,
-    130050,
-    130051,
-    130052,
-    130053,
-    130054,
-    130055,
-    130056,
-    130057,
-    130058,
-    130059,
-    130060,
-    130061,
-    130062,
-    130063,
-    130064,
-    130065,
-    130066,
-    130067,
-    130068,
-    130069,
-    130070,
-    130071,
-    130072,
-    130073,
-    130074,
-    130075,
-    130076,
-    130077,
-    130078,
-    130079,
-    130080,
-    130081,
-    130082,
-    130083,
-    130084,
-    130085,
-    130086,
-    130087,
-    130088,
-    130089,
-    130090,
-    130091,
-    130092,
-    130093,
-    130094,
-    130095,
-    130096,
-    130097,
-    130098,
-    130099,
-    130100,
-    130101,
-    130102,
-    130103,
-    130104,
-    130105,
-    130106,
-    130107,
-    130108,
-    130109,
-    130110,
-    130111,
-    130112,
-    130113,
-    130114,
-    130115,
-    130116,
-    130117,
-    130118,
-    130119,
-    130120,
-    130121,
-    130122,
-    130123,
-    130124,
-    130125,
-    130126,
-    130127,
-    130128,
-    130129,
-    130130,
-    130131,
-    130132,
-    130133,
-    130134,
-    130135,
-    130136,
-    130137,
-    130138,
-    130139,
-    130140,
-    130141,
-    130142,
-    130143,
-    130144,
-    130145,
-    130146,
-    130147,
-    130148,
-    130149,
-    130150,
-    130151,
-    130152,
-    130153,
-    130154,
-    130155,
-    130156,
-    130157,
-    130158,
-    130159,
-    130160,
-    130161,
-    130162,
-    130163,
-    130164,
-    130165,
-    130166,
-    130167,
-    130168,
-    130169,
-    130170,
-    130171,
-    130172,
-    130173,
-    130174,
-    130175,
-    130176,
-    130177,
-    130178,
-    130179,
-    130180,
-    130181,
-    130182,
-    130183,
-    130184,
-    130185,
-    130186,
-    130187,
-    130188,
-    130189,
-    130190,
-    130191,
-    130192,
-    130193,
-    130194,
-    130195,
-    130196,
-    130197,
-    130198,
-    130199,
-    130200,
-    130201,
-    130202,
-    130203,
-    130204,
-    130205,
-    130206,
-    130207,
-    130208,
-    130209,
-    130210,
-    130211,
-    130212,
-    130213,
-    130214,
-    130215,
-    130216,
-    130217,
-    130218,
-    130219,
-    130220,
-    130221,
-    130222,
-    130223,
-    130224,
-    130225,
-    130226,
-    130227,
-    130228,
-    130229,
-    130230,
-    130231,
-    130232,
-    130233,
-    130234,
-    130235,
-    130236,
-    130237,
-    130238,
-    130239,
-    130240,
-    130241,
-    130242,
-    130243,
-    130244,
-    130245,
-    130246,
-    130247,
-    130248,
-    130249,
-    130250,
-    130251,
-    130252,
-    130253,
-    130254,
-    130255,
-    130256,
-    130257,
-    130258,
-    130259,
-    130260,
-    130261,
-    130262,
-    130263,
-    130264,
-    130265,
-    130266,
-    130267,
-    130268,
-    130269,
-    130270,
-    130271,
-    130272,
-    130273,
-    130274,
-    130275,
-    130276,
-    130277,
-    130278,
-    130279,
-    130280,
-    130281,
-    130282,
-    130283,
-    130284,
-    130285,
-    130286,
-    130287,
-    130288,
-    130289,
-    130290,
-    130291,
-    130292,
-    130293,
-    130294,
-    130295,
-    130296,
-    130297,
-    130298,
-    130299,
-    130300,
-    130301,
-    130302,
-    130303,
-    130304,
-    130305,
-    130306,
-    130307,
-    130308,
-    130309,
-    130310,
-    130311,
-    130312,
-    130313,
-    130314,
-    130315,
-    130316,
-    130317,
-    130318,
-    130319,
-    130320,
-    130321,
-    130322,
-    130323,
-    130324,
-    130325,
-    130326,
-    130327,
-    130328,
-    130329,
-    130330,
-    130331,
-    130332,
-    130333,
-    130334,
-    130335,
-    130336,
-    130337,
-    130338,
-    130339,
-    130340,
-    130341,
-    130342,
-    130343,
-    130344,
-    130345,
-    130346,
-    130347,
-    130348,
-    130349,
-    130350,
-    130351,
-    130352,
-    130353,
-    130354,
-    130355,
-    130356,
-    130357,
-    130358,
-    130359,
-    130360,
-    130361,
-    130362,
-    130363,
-    130364,
-    130365,
-    130366,
-    130367,
-    130368,
-    130369,
-    130370,
-    130371,
-    130372,
-    130373,
-    130374,
-    130375,
-    130376,
-    130377,
-    130378,
-    130379,
-    130380,
-    130381,
-    130382,
-    130383,
-    130384,
-    130385,
-    130386,
-    130387,
-    130388,
-    130389,
-    130390,
-    130391,
-    130392,
-    130393,
-    130394,
-    130395,
-    130396,
-    130397,
-    130398,
-    130399,
-    130400,
-    130401,
-    130402,
-    130403,
-    130404,
-    130405,
-    130406,
-    130407,
-    130408,
-    130409,
-    130410,
-    130411,
-    130412,
-    130413,
-    130414,
-    130415,
-    130416,
-    130417,
-    130418,
-    130419,
-    130420,
-    130421,
-    130422,
-    130423,
-    130424,
-    130425,
-    130426,
-    130427,
-    130428,
-    130429,
-    130430,
-    130431,
-    130432,
-    130433,
-    130434,
-    130435,
-    130436,
-    130437,
-    130438,
-    130439,
-    130440,
-    130441,
-    130442,
-    130443,
-    130444,
-    130445,
-    130446,
-    130447,
-    130448,
-    130449,
-    130450,
-    130451,
-    130452,
-    130453,
-    130454,
-    130455,
-    130456,
-    130457,
-    130458,
-    130459,
-    130460,
-    130461,
-    130462,
-    130463,
-    130464,
-    130465,
-    130466,
-    130467,
-    130468,
-    130469,
-    130470,
-    130471,
-    130472,
-    130473,
-    130474,
-    130475,
-    130476,
-    130477,
-    130478,
-    130479,
-    130480,
-    130481,
-    130482,
-    130483,
-    130484,
-    130485,
-    130486,
-    130487,
-    130488,
-    130489,
-    130490,
-    130491,
-    130492,
-    130493,
-    130494,
-    130495,
-    130496,
-    130497,
-    130498,
-    130499,
-    130500,
-    130501,
-    130502,
-    130503,
-    130504,
-    130505,
-    130506,
-    130507,
-    130508,
-    130509,
-    130510,
-    130511,
-    130512,
-    130513,
-    130514,
-    130515,
-    130516,
-    130517,
-    130518,
-    130519,
-    130520,
-    130521,
-    130522,
-    130523,
-    130524,
-    130525,
-    130526,
-    130527,
-    130528,
-    130529,
-    130530,
-    130531,
-    130532,
-    130533,
-    130534,
-    130535,
-    130536,
-    130537,
-    130538,
-    130539,
-    130540,
-    130541,
-    130542,
-    130543,
-    130544,
-    130545,
-    130546,
-    130547,
-    130548,
-    130549,
-    130550,
-    130551,
-    130552,
-    130553,
-    130554,
-    130555,
-    130556,
-    130557,
-    130558,
-    130559,
-    130560,
-    130561,
-    130562,
-    130563,
-    130564,
-    130565,
-    130566,
-    130567,
-    130568,
-    130569,
-    130570,
-    130571,
-    130572,
-    130573,
-    130574,
-    130575,
-    130576,
-    130577,
-    130578,
-    130579,
-    130580,
-    130581,
-    130582,
-    130583,
-    130584,
-    130585,
-    130586,
-    130587,
-    130588,
-    130589,
-    130590,
-    130591,
-    130592,
-    130593,
-    130594,
-    130595,
-    130596,
-    130597,
-    130598,
-    130599,
-    130600,
-    130601,
-    130602,
-    130603,
-    130604,
-    130605,
-    130606,
-    130607,
-    130608,
-    130609,
-    130610,
-    130611,
-    130612,
-    130613,
-    130614,
-    130615,
-    130616,
-    130617,
-    130618,
-    130619,
-    130620,
-    130621,
-    130622,
-    130623,
-    130624,
-    130625,
-    130626,
-    130627,
-    130628,
-    130629,
-    130630,
-    130631,
-    130632,
-    130633,
-    130634,
-    130635,
-    130636,
-    130637,
-    130638,
-    130639,
-    130640,
-    130641,
-    130642,
-    130643,
-    130644,
-    130645,
-    130646,
-    130647,
-    130648,
-    130649,
-    130650,
-    130651,
-    130652,
-    130653,
-    130654,
-    130655,
-    130656,
-    130657,
-    130658,
-    130659,
-    130660,
-    130661,
-    130662,
-    130663,
-    130664,
-    130665,
-    130666,
-    130667,
-    130668,
-    130669,
-    130670,
-    130671,
-    130672,
-    130673,
-    130674,
-    130675,
-    130676,
-    130677,
-    130678,
-    130679,
-    130680,
-    130681,
-    130682,
-    130683,
-    130684,
-    130685,
-    130686,
-    130687,
-    130688,
-    130689,
-    130690,
-    130691,
-    130692,
-    130693,
-    130694,
-    130695,
-    130696,
-    130697,
-    130698,
-    130699,
-    130700,
-    130701,
-    130702,
-    130703,
-    130704,
-    130705,
-    130706,
-    130707,
-    130708,
-    130709,
-    130710,
-    130711,
-    130712,
-    130713,
-    130714,
-    130715,
-    130716,
-    130717,
-    130718,
-    130719,
-    130720,
-    130721,
-    130722,
-    130723,
-    130724,
-    130725,
-    130726,
-    130727,
-    130728,
-    130729,
-    130730,
-    130731,
-    130732,
-    130733,
-    130734,
-    130735,
-    130736,
-    130737,
-    130738,
-    130739,
-    130740,
-    130741,
-    130742,
-    130743,
-    130744,
-    130745,
-    130746,
-    130747,
-    130748,
-    130749,
-    130750,
-    130751,
-    130752,
-    130753,
-    130754,
-    130755,
-    130756,
-    130757,
-    130758,
-    130759,
-    130760,
-    130761,
-    130762,
-    130763,
-    130764,
-    130765,
-    130766,
-    130767,
-    130768,
-    130769,
-    130770,
-    130771,
-    130772,
-    130773,
-    130774,
-    130775,
-    130776,
-    130777,
-    130778,
-    130779,
-    130780,
-    130781,
-    130782,
-    130783,
-    130784,
-    130785,
-    130786,
-    130787,
-    130788,
-    130789,
-    130790,
-    130791,
-    130792,
-    130793,
-    130794,
-    130795,
-    130796,
-    130797,
-    130798,
-    130799,
-    130800,
-    130801,
-    130802,
-    130803,
-    130804,
-    130805,
-    130806,
-    130807,
-    130808,
-    130809,
-    130810,
-    130811,
-    130812,
-    130813,
-    130814,
-    130815,
-    130816,
-    130817,
-    130818,
-    130819,
-    130820,
-    130821,
-    130822,
-    130823,
-    130824,
-    130825,
-    130826,
-    130827,
-    130828,
-    130829,
-    130830,
-    130831,
-    130832,
-    130833,
-    130834,
-    130835,
-    130836,
-    130837,
-    130838,
-    130839,
-    130840,
-    130841,
-    130842,
-    130843,
-    130844,
-    130845,
-    130846,
-    130847,
-    130848,
-    130849,
-    130850,
-    130851,
-    130852,
-    130853,
-    130854,
-    130855,
-    130856,
-    130857,
-    130858,
-    130859,
-    130860,
-    130861,
-    130862,
-    130863,
-    130864,
-    130865,
-    130866,
-    130867,
-    130868,
-    130869,
-    130870,
-    130871,
-    130872,
-    130873,
-    130874,
-    130875,
-    130876,
-    130877,
-    130878,
-    130879,
-    130880,
-    130881,
-    130882,
-    130883,
-    130884,
-    130885,
-    130886,
-    130887,
-    130888,
-    130889,
-    130890,
-    130891,
-    130892,
-    130893,
-    130894,
-    130895,
-    130896,
-    130897,
-    130898,
-    130899,
-    130900,
-    130901,
-    130902,
-    130903,
-    130904,
-    130905,
-    130906,
-    130907,
-    130908,
-    130909,
-    130910,
-    130911,
-    130912,
-    130913,
-    130914,
-    130915,
-    130916,
-    130917,
-    130918,
-    130919,
-    130920,
-    130921,
-    130922,
-    130923,
-    130924,
-    130925,
-    130926,
-    130927,
-    130928,
-    130929,
-    130930,
-    130931,
-    130932,
-    130933,
-    130934,
-    130935,
-    130936,
-    130937,
-    130938,
-    130939,
-    130940,
-    130941,
-    130942,
-    130943,
-    130944,
-    130945,
-    130946,
-    130947,
-    130948,
-    130949,
-    130950,
-    130951,
-    130952,
-    130953,
-    130954,
-    130955,
-    130956,
-    130957,
-    130958,
-    130959,
-    130960,
-    130961,
-    130962,
-    130963,
-    130964,
-    130965,
-    130966,
-    130967,
-    130968,
-    130969,
-    130970,
-    130971,
-    130972,
-    130973,
-    130974,
-    130975,
-    130976,
-    130977,
-    130978,
-    130979,
-    130980,
-    130981,
-    130982,
-    130983,
-    130984,
-    130985,
-    130986,
-    130987,
-    130988,
-    130989,
-    130990,
-    130991,
-    130992,
-    130993,
-    130994,
-    130995,
-    130996,
-    130997,
-    130998,
-    130999,
-    131000,
-    131001,
-    131002,
-    131003,
-    131004,
-    131005,
-    131006,
-    131007,
-    131008,
-    131009,
-    131010,
-    131011,
-    131012,
-    131013,
-    131014,
-    131015,
-    131016,
-    131017,
-    131018,
-    131019,
-    131020,
-    131021,
-    131022,
-    131023,
-    131024,
-    131025,
-    131026,
-    131027,
-    131028,
-    131029,
-    131030,
-    131031,
-    131032,
-    131033,
-    131034,
-    131035,
-    131036,
-    131037,
-    131038,
-    131039,
-    131040,
-    131041,
-    131042,
-    131043,
-    131044,
-    131045,
-    131046,
-    131047,
-    131048,
-    131049,
-    131050,
-    131051,
-    131052,
-    131053,
-    131054,
-    131055,
-    131056,
-    131057,
-    131058,
-    131059,
-    131060,
-    131061,
-    131062,
-    131063,
-    131064,
-    131065,
-    131066,
-    131067,
-    131068,
-    131069,
-    917536,
-    917537,
-    917538,
-    917539,
-    917540,
-    917541,
-    917542,
-    917543,
-    917544,
-    917545,
-    917546,
-    917547,
-    917548,
-    917549,
-    917550,
-    917551,
-    917552,
-    917553,
-    917554,
-    917555,
-    917556,
-    917557,
-    917558,
-    917559,
-    917560,
-    917561,
-    917562,
-    917563,
-    917564,
-    917565,
-    917566,
-    917567,
-    917568,
-    917569,
-    917570,
-    917571,
-    917572,
-    917573,
-    917574,
-    917575,
-    917576,
-    917577,
-    917578,
-    917579,
-    917580,
-    917581,
-    917582,
-    917583,
-    917584,
-    917585,
-    917586,
-    917587,
-    917588,
-    917589,
-    917590,
-    917591,
-    917592,
-    917593,
-    917594,
-    917595,
-    917596,
-    917597,
-    917598,
-    917599,
-    917600,
-    917601,
-    917602,
-    917603,
-    917604,
-    917605,
-    917606,
-    917607,
-    917608,
-    917609,
-    917610,
-    917611,
-    917612,
-    917613,
-    917614,
-    917615,
-    917616,
-    917617,
-    917618,
-    917619,
-    917620,
-    917621,
-    917622,
-    917623,
-    917624,
-    917625,
-    917626,
-    917627,
-    917628,
-    917629,
-    917630,
-    917631
+from bisect import bisect_right
+import re
+
+# Sorted, non-overlapping code point ranges (both ends inclusive)
+EMOJI_STARTS = [
+    0x2194,
+    0x21A9,
+    0x231A,
+    0x23E9,
+    0x23F1,
+    0x23F8,
+    0x25AA,
+    0x25FB,
+    0x2600,
+    0x2607,
+    0x260F,
+    0x2614,
+    0x2619,
+    0x261E,
+    0x2622,
+    0x2627,
+    0x262B,
+    0x2630,
+    0x263B,
+    0x2643,
+    0x2661,
+    0x2665,
+    0x2669,
+    0x267C,
+    0x2680,
+    0x2690,
+    0x2696,
+    0x269B,
+    0x26A8,
+    0x26C9,
+    0x26D5,
+    0x26EB,
+    0x26F7,
+    0x26FB,
+    0x26FE,
+    0x2703,
+    0x2708,
+    0x2710,
+    0x2733,
+    0x2753,
+    0x2765,
+    0x2795,
+    0x2934,
+    0x2B05,
+    0x2B1B,
+    0x1F000,
+    0x1F005,
+    0x1F0D0,
+    0x1F10D,
+    0x1F16C,
+    0x1F17E,
+    0x1F191,
+    0x1F1AD,
+    0x1F201,
+    0x1F232,
+    0x1F23C,
+    0x1F249,
+    0x1F313,
+    0x1F31D,
+    0x1F322,
+    0x1F337,
+    0x1F34C,
+    0x1F351,
+    0x1F37E,
+    0x1F399,
+    0x1F3CB,
+    0x1F3E5,
+    0x1F3F8,
+    0x1F409,
+    0x1F417,
+    0x1F42B,
+    0x1F442,
+    0x1F466,
+    0x1F4AE,
+    0x1F4F0,
+    0x1F4F6,
+    0x1F4F9,
+    0x1F4FF,
+    0x1F504,
+    0x1F50A,
+    0x1F516,
+    0x1F546,
+    0x1F550,
+    0x1F57B,
+    0x1F588,
+    0x1F591,
+    0x1F5A6,
+    0x1F5A9,
+    0x1F5BD,
+    0x1F5E4,
+    0x1F5E9,
+    0x1F5F0,
+    0x1F5F4,
+    0x1F5FB,
+    0x1F601,
+    0x1F612,
+    0x1F61C,
+    0x1F620,
+    0x1F62E,
+    0x1F637,
+    0x1F681,
+    0x1F68A,
+    0x1F691,
+    0x1F699,
+    0x1F6A4,
+    0x1F6A7,
+    0x1F6B3,
+    0x1F6B7,
+    0x1F6C1,
+    0x1F6CD,
+    0x1F6D1,
+    0x1F6D6,
+    0x1F6EB,
+    0x1F6F1,
+    0x1F6F4,
+    0x1F6FB,
+    0x1F774,
+    0x1F7D5,
+    0x1F7F1,
+    0x1F80C,
+    0x1F848,
+    0x1F85A,
+    0x1F888,
+    0x1F8AE,
+    0x1F90D,
+    0x1F920,
+    0x1F931,
+    0x1F93C,
+    0x1F940,
+    0x1F947,
+    0x1F94D,
+    0x1F973,
+    0x1F97C,
+    0x1F9C1,
+    0x1F9CD,
+    0x1FA75,
+    0x1FC00,
+    0xE0020,
 ]
+EMOJI_ENDS = [
+    0x2199,
+    0x21AA,
+    0x231B,
+    0x23EE,
+    0x23F2,
+    0x23FA,
+    0x25AB,
+    0x25FE,
+    0x2603,
+    0x260D,
+    0x2610,
+    0x2617,
+    0x261C,
+    0x261F,
+    0x2625,
+    0x2629,
+    0x262D,
+    0x2639,
+    0x263F,
+    0x265E,
+    0x2662,
+    0x2666,
+    0x267A,
+    0x267D,
+    0x2685,
+    0x2691,
+    0x2697,
+    0x26A6,
+    0x26C7,
+    0x26CD,
+    0x26E8,
+    0x26F3,
+    0x26F9,
+    0x26FC,
+    0x2701,
+    0x2704,
+    0x270C,
+    0x2711,
+    0x2734,
+    0x2755,
+    0x2767,
+    0x2797,
+    0x2935,
+    0x2B07,
+    0x2B1C,
+    0x1F003,
+    0x1F0CE,
+    0x1F0FF,
+    0x1F10F,
+    0x1F171,
+    0x1F17F,
+    0x1F19A,
+    0x1F1FF,
+    0x1F20F,
+    0x1F23A,
+    0x1F23F,
+    0x1F30E,
+    0x1F318,
+    0x1F320,
+    0x1F335,
+    0x1F34A,
+    0x1F34F,
+    0x1F37B,
+    0x1F397,
+    0x1F3C4,
+    0x1F3E3,
+    0x1F3F2,
+    0x1F407,
+    0x1F412,
+    0x1F429,
+    0x1F43E,
+    0x1F464,
+    0x1F4AC,
+    0x1F4ED,
+    0x1F4F4,
+    0x1F4F7,
+    0x1F4FC,
+    0x1F502,
+    0x1F507,
+    0x1F514,
+    0x1F53D,
+    0x1F54E,
+    0x1F579,
+    0x1F586,
+    0x1F58F,
+    0x1F5A3,
+    0x1F5A7,
+    0x1F5BB,
+    0x1F5E0,
+    0x1F5E7,
+    0x1F5EE,
+    0x1F5F2,
+    0x1F5F9,
+    0x1F5FF,
+    0x1F60D,
+    0x1F614,
+    0x1F61E,
+    0x1F62B,
+    0x1F633,
+    0x1F64F,
+    0x1F685,
+    0x1F68B,
+    0x1F693,
+    0x1F6A1,
+    0x1F6A5,
+    0x1F6B1,
+    0x1F6B5,
+    0x1F6BE,
+    0x1F6CA,
+    0x1F6CF,
+    0x1F6D4,
+    0x1F6E8,
+    0x1F6EF,
+    0x1F6F2,
+    0x1F6F8,
+    0x1F6FF,
+    0x1F77F,
+    0x1F7EF,
+    0x1F7FF,
+    0x1F80F,
+    0x1F84F,
+    0x1F85F,
+    0x1F88F,
+    0x1F8FF,
+    0x1F91E,
+    0x1F92F,
+    0x1F93A,
+    0x1F93E,
+    0x1F945,
+    0x1F94B,
+    0x1F970,
+    0x1F978,
+    0x1F9BF,
+    0x1F9CA,
+    0x1FA73,
+    0x1FAFF,
+    0x1FFFD,
+    0xE007F,
+]
+
+EMOJI_RE = re.compile("[" + "".join(
+    f"{re.escape(chr(start))}-{re.escape(chr(end))}"
+    for start, end in zip(EMOJI_STARTS, EMOJI_ENDS)) + "]")
+
+
+def is_emoji(char: str) -> bool:
+    """Check if char is an emoji (bisect over the ranges)
+
+    Args:
+        char (str): Single character
+
+    Returns:
+        bool: Whether char is an emoji
+    """
+    code = ord(char)
+    idx = bisect_right(EMOJI_STARTS, code) - 1
+    return idx >= 0 and code <= EMOJI_ENDS[idx]
+
+
+def count_emojis(text: str) -> int:
+    """Count emoji characters in text
+
+    Args:
+        text (str): Text (e.g. subject)
+
+    Returns:
+        int: Number of emoji characters
+    """
+    if text.isascii():
+        return 0
+    return len(EMOJI_RE.findall(text))
@@ -0,0 +1,218 @@
+# Copyright 2022 Jakob Schaffarczyk
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Approximate matching of many phrases against the n-grams of a mail
+"""
+from bisect import bisect_right
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+from classes import Content
+
+# Length of the q-grams in the inverted index
+Q = 2
+
+
+def qgrams(text: str) -> Counter:
+    """Overlapping q-grams of text
+
+    Args:
+        text (str): Text
+
+    Returns:
+        Counter: Number of occurrences per q-gram
+    """
+    return Counter(text[i:i + Q] for i in range(len(text) - Q + 1))
+
+
+class PhraseMatcher:
+    """Precompiled phrase list; finds the highest similarity threshold
+    (fuzz.ratio) each phrase reaches against the n-grams of a text.
+
+    fuzz.ratio is 2 * M / (len(a) + len(b)) with M the number of characters
+    of a common subsequence (matching blocks or LCS, depending on the
+    backend). Candidates are found and pruned with three bounds before the
+    exact ratio is computed:
+    - q-grams: the M characters form at most len(a) + len(b) - 2 * M + 1 runs
+      that are contiguous in both strings and a run of length r holds
+      r - q + 1 q-grams, so a and b share at least
+      (2q - 1) * M - (q - 1) * (len(a) + len(b) + 1) q-grams. Shared q-grams
+      are counted with an inverted index q-gram -> phrases, so only phrases
+      sharing enough q-grams with an n-gram are looked at
+    - length: M <= min(len(a), len(b))
+    - LCS: M <= length of the longest common subsequence, computed
+      bit-parallel (Hyyro) with the character masks of the phrase
+    Short pairs may reach a threshold without any shared q-gram; those
+    phrases are looked up by length instead.
+    """
+
+    def __init__(self, phrases: Iterable[str], thresholds: Tuple[int, ...] = (70, 90)):
+        """Compile phrases
+
+        Args:
+            phrases (Iterable[str]): Phrases (case insensitive)
+            thresholds (Tuple[int, ...], optional): Ratios to report. Defaults to (70, 90).
+        """
+        self.phrases: List[str] = [phrase.lower() for phrase in phrases]
+        self.thresholds = tuple(sorted(thresholds))
+        # number of words -> [(index, phrase, character -> bit mask of positions)]
+        self._groups: Dict[int, List[Tuple[int, str, Dict[str, int]]]] = {}
+        # number of words -> q-gram -> [(position in group, count)]
+        self._index: Dict[int, Dict[str, List[Tuple[int, int]]]] = {}
+        # number of words -> phrase length -> positions in group
+        self._lengths: Dict[int, Dict[int, List[int]]] = {}
+        for idx, phrase in enumerate(self.phrases):
+            if not phrase:
+                continue
+            n = len(phrase.split(" "))
+            group = self._groups.setdefault(n, [])
+            pos = len(group)
+            masks: Dict[str, int] = {}
+            for i, char in enumerate(phrase):
+                masks[char] = masks.get(char, 0) | 1 << i
+            group.append((idx, phrase, masks))
+            index = self._index.setdefault(n, {})
+            for gram, count in qgrams(phrase).items():
+                index.setdefault(gram, []).append((pos, count))
+            self._lengths.setdefault(n, {}).setdefault(len(phrase), []).append(pos)
+        self._sorted_lengths = {n: sorted(lengths) for n, lengths in self._lengths.items()}
+        # Longest pair (sum of lengths) that may reach the lowest threshold
+        # without a shared q-gram; 23 for q = 2 and 70
+        self._loose = max((total for total in range(1, 1024) if self.thresholds
+                           and self._shared(total, self.thresholds[0]) <= 0), default=0)
+
+    def _next(self, level: int) -> int:
+        """internal: Next threshold above level (0 if none left)
+
+        Args:
+            level (int): Current level
+
+        Returns:
+            int: Next threshold
+        """
+        for threshold in self.thresholds:
+            if threshold > level:
+                return threshold
+        return 0
+
+    @staticmethod
+    def _common(total: int, threshold: int) -> int:
+        """internal: Minimum number of matching characters M of a pair for
+        ratio 2 * M / total to round to threshold
+
+        Args:
+            total (int): Sum of both lengths
+            threshold (int): Ratio in percent
+
+        Returns:
+            int: Matching characters
+        """
+        # fuzz.ratio rounds, 69.5 counts as 70
+        return -(-(2 * threshold - 1) * total // 400)
+
+    @staticmethod
+    def _lcs(masks: Dict[str, int], size: int, text: str, need: int = 0) -> int:
+        """internal: Length of the longest common subsequence (bit-parallel);
+        stops as soon as need can't be reached anymore
+
+        Args:
+            masks (Dict[str, int]): Character -> bit mask of its positions in the phrase
+            size (int): Length of the phrase
+            text (str): Text to compare with
+            need (int, optional): Length of interest. Defaults to 0.
+
+        Returns:
+            int: LCS length; an upper bound below need if stopped early
+        """
+        full = (1 << size) - 1
+        row = full
+        left = len(text)
+        for char in text:
+            match = row & masks.get(char, 0)
+            row = ((row + match) | (row - match)) & full
+            left -= 1
+            if size - row.bit_count() + left < need:
+                break
+        return size - row.bit_count() + left
+
+    @classmethod
+    def _shared(cls, total: int, threshold: int) -> int:
+        """internal: Minimum number of shared q-grams of a pair reaching threshold
+
+        Args:
+            total (int): Sum of both lengths
+            threshold (int): Ratio in percent
+
+        Returns:
+            int: Shared q-grams; <= 0 if no q-gram needs to be shared
+        """
+        return (2 * Q - 1) * cls._common(total, threshold) - (Q - 1) * (total + 1)
+
+    def levels(self, text: Content) -> List[int]:
+        """Get highest threshold each phrase reaches against n-grams of text
+
+        Args:
+            text (Content): Mail content
+
+        Returns:
+            List[int]: Reached threshold per phrase (0 if none), same order as phrases
+        """
+        from fuzzywuzzy import fuzz
+        levels = [0] * len(self.phrases)
+        first = self._next(0)
+        for n, group in self._groups.items():
+            grams = set(text.ngrams(n))
+            if not grams:
+                continue
+            index = self._index[n]
+            lengths = self._lengths[n]
+            sorted_lengths = self._sorted_lengths[n]
+            targets = [first] * len(group)
+            left = len(group)
+            # (total, threshold) -> (matching characters, shared q-grams)
+            bounds: Dict[Tuple[int, int], Tuple[int, int]] = {}
+            for gram in grams:
+                if not left:
+                    break
+                len_g = len(gram)
+                # shared q-grams per phrase (multiset intersection)
+                shared: Dict[int, int] = {}
+                for qgram, count in qgrams(gram).items():
+                    for pos, phrase_count in index.get(qgram, ()):
+                        shared[pos] = shared.get(pos, 0) + min(count, phrase_count)
+                candidates = set(shared)
+                for len_p in sorted_lengths[:bisect_right(sorted_lengths, self._loose - len_g)]:
+                    candidates.update(lengths[len_p])
+                for pos in candidates:
+                    target = targets[pos]
+                    if not target:
+                        continue
+                    idx, phrase, masks = group[pos]
+                    len_p = len(phrase)
+                    total = len_p + len_g
+                    bound = bounds.get((total, target))
+                    if bound is None:
+                        bound = bounds[(total, target)] = (self._common(total, target),
+                                                           self._shared(total, target))
+                    common, need = bound
+                    if min(len_p, len_g) < common or shared.get(pos, 0) < need:
+                        continue
+                    if self._lcs(masks, len_p, gram, common) < common:
+                        continue
+                    ratio = fuzz.ratio(phrase, gram)
+                    while target and ratio >= target:
+                        levels[idx] = target
+                        target = self._next(target)
+                    targets[pos] = target
+                    if not target:
+                        left -= 1
+        return levels
@@ -13,18 +13,17 @@
 # limitations under the License.
 """Helper methods
 """
-from base64 import decodebytes
-import email
+from functools import lru_cache
+from io import BytesIO
+from email.parser import BytesHeaderParser
 import re
-from typing import Any
-import langdetect
-import colorama
-from colorama import Fore
-from bs4 import BeautifulSoup as bs4
+from typing import Any, BinaryIO
 from classes import Content, Headers
+from mime import MimeWalker, read_header_block
+from htmltext import html_to_text, is_html
+from distance import levenshtein
 
 
-colorama.init()
 EXT_MESSAGE = re.compile(
     r'this[\n\s]*message[\n\s]*is[\n\s]*from[\n\s]*an[\n\s]*external'
     r'[\n\s]*sender[\n\s]*-[\n\s]*be[\n\s]*cautious,'
@@ -104,58 +103,88 @@ def detect_lang(rawtext: str) -> str:
     :return: Detected language
     """
     try:
+        import langdetect
         return langdetect.detect(rawtext)
     except Exception as exception:
         raise exception
 
 
-def read_eml(fname: str) -> dict:
-    """Parse Email
+def read_eml(fname: str, headers_only: bool = False, attachments: bool = False) -> dict:
+    """Parse Email; only the body part is decoded, attachments are skipped
     :param fname: filename
-    :return: Mail context (headers, body)
+    :param headers_only: stop at the end of the header block; body is empty
+    :param attachments: record name, type and size of attachments
+    :return: Mail context (headers, body, attachments, links)
     """
-    context = {}
     with open(fname, 'rb') as fp:
-        msg = email.message_from_binary_file(fp)
-        context["Headers"] = Headers(msg)
-        if msg.is_multipart():
-            for part in msg.walk():
-                content_type = part.get_content_type()
-                content_disposition = str(part.get("Content-Disposition"))
-                try:
-                    body = part.get_payload(decode=True).decode()
-                except (AttributeError, UnicodeDecodeError):
-                    body = part.get_payload()
-                except:
-                    print(part.get_payload())
-                    for subpart in part.get_payload():
-                        try:
-                            content_transfer_encoding = subpart["Content-Transfer-Encoding"]
-                        except Exception as exception:
-                            raise exception from Exception(f"Something went wrong analysing '{fname}'")
-                        content_charset = subpart["Content-Type"].split('="')[
-                            1][:-1]
-                        content_type = subpart["Content-Type"].split("; ")[0]
-                        if content_transfer_encoding == "base64" and content_type == "text/plain":
-                            body = decodebytes(subpart.get_payload().encode()).decode(
-                                content_charset)
-                            context["Body"] = Content(body)
-                            break
-                if content_type == "text/plain" and "attachment" not in content_disposition:
-                    context["Body"] = Content(body)
-                    break
-        else:
-            content_type = msg.get_content_type()
-            context["Body"] = Content(msg.get_payload(decode=True).decode())
-    if context["Body"].startswith("<html>"):
-        soup = bs4(str(context["Body"]), "lxml")
+        return read_eml_fp(fp, headers_only, attachments)
+
+
+def read_eml_fp(fp: BinaryIO, headers_only: bool = False, attachments: bool = False) -> dict:
+    """Parse Email from file object (e.g. a mail inside an mbox)
+    :param fp: mail file opened in binary mode
+    :param headers_only: stop at the end of the header block; body is empty
+    :param attachments: record name, type and size of attachments
+    :return: Mail context (headers, body, attachments, links)
+    """
+    if headers_only:
+        return parse_eml_headers(read_header_block(fp))
+    return parse_eml(fp, attachments)
+
+
+def read_eml_bytes(data: bytes, headers_only: bool = False, attachments: bool = False) -> dict:
+    """Parse Email from raw bytes
+    :param data: raw mail
+    :param headers_only: ignore everything after the header block; body is empty
+    :param attachments: record name, type and size of attachments
+    :return: Mail context (headers, body, attachments, links)
+    """
+    if headers_only:
+        return parse_eml_headers(data)
+    return parse_eml(BytesIO(data), attachments)
+
+
+def parse_eml_headers(data: bytes) -> dict:
+    """Parse headers of mail; everything after the header block is ignored
+    :param data: raw headers (or raw mail)
+    :return: Mail context (headers, empty body)
+    """
+    msg = BytesHeaderParser().parsebytes(data)
+    return {"Headers": Headers(msg), "Body": "", "Attachments": [], "Links": []}
+
+
+def parse_eml(fp: BinaryIO, attachments: bool = False) -> dict:
+    """Extract headers and body from mail file
+    :param fp: mail file opened in binary mode
+    :param attachments: record name, type and size of attachments
+    :return: Mail context (headers, body, attachments, links)
+    """
+    walked = MimeWalker(attachments=attachments).walk(fp)
+    body = walked["Body"] or ""
+    links = []
+    if is_html(body, walked["BodyType"]):
         try:
-            context["Body"] = soup.get_text()
+            body, links = html_to_text(body)
         except Exception as e:
             debug(str(e))
+    return {
+        "Headers": Headers(walked["Message"]),
+        "Body": del_ext_message(str(Content(body))),
+        "Attachments": walked["Attachments"],
+        "Links": links,
+    }
 
-    context["Body"] = del_ext_message(str(context["Body"]))
-    return context
+
+@lru_cache(maxsize=None)
+def _colors() -> Any:
+    """internal: Init colorama on first debug message
+
+    Returns:
+        Any: colorama.Fore
+    """
+    import colorama
+    colorama.init()
+    return colorama.Fore
 
 
 def debug(msg: Any):
@@ -164,7 +193,8 @@ def debug(msg: Any):
     Args:
         msg (Any): debug message
     """
-    print(f"{Fore.CYAN}>>>{Fore.RESET} {msg}")
+    fore = _colors()
+    print(f"{fore.CYAN}>>>{fore.RESET} {msg}")
 
 
 def levenshteinDist(s1: str, s2: str) -> int:
@@ -177,17 +207,4 @@ def levenshteinDist(s1: str, s2: str) -> int:
     Returns:
         int: Calculated Levenshtein distance
     """
-    m = len(s1)
-    n = len(s2)
-    d = [[i] for i in range(1, m+1)]  # d matrix rows
-    d.insert(0, list(range(0, n+1)))  # d matrix columns
-    for j in range(1, n+1):
-        for i in range(1, m+1):
-            if s1[i-1] == s2[j-1]:
-                substitution_cost = 0
-            else:
-                substitution_cost = 1
-            d[i].insert(j, min(d[i-1][j] + 1,
-                               d[i][j-1] + 1,
-                               d[i-1][j-1] + substitution_cost))
-    return d[-1][-1]
+    return levenshtein(s1, s2)
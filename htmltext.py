@@ -0,0 +1,97 @@
+# Copyright 2022 Jakob Schaffarczyk
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Bounded HTML to text extraction for mail bodies
+"""
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
+from settings import html_max_size
+
+CHUNK_SIZE = 64 * 1024
+SKIP_TAGS = {"script", "style"}
+LINK_ATTRS = {"a": "href", "area": "href"}
+
+
+class HtmlText(HTMLParser):
+    """Event based HTML parser collecting text and link targets;
+    no tree is built, content of script/style is dropped
+    """
+
+    def __init__(self):
+        """Init extractor
+        """
+        super().__init__(convert_charrefs=True)
+        self.text: List[str] = []
+        self.links: List[str] = []
+        self._skip = 0
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        """Skip script/style, remember link targets
+
+        Args:
+            tag (str): Tag name (lower case)
+            attrs (List[Tuple[str, Optional[str]]]): Attributes of the tag
+        """
+        if tag in SKIP_TAGS:
+            self._skip += 1
+        elif tag in LINK_ATTRS:
+            for name, val in attrs:
+                if name == LINK_ATTRS[tag] and val:
+                    self.links.append(val.strip())
+
+    def handle_endtag(self, tag: str):
+        """Leave script/style
+
+        Args:
+            tag (str): Tag name (lower case)
+        """
+        if tag in SKIP_TAGS and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data: str):
+        """Collect text outside of script/style
+
+        Args:
+            data (str): Text with resolved character references
+        """
+        if not self._skip:
+            self.text.append(data)
+
+
+def is_html(body: str, content_type: Optional[str] = None) -> bool:
+    """Check if body is HTML; uses the content type of the body part and
+    falls back to sniffing for bodies declared as text/plain
+    :param body: decoded body
+    :param content_type: content type of the body part
+    :return: whether body has to be converted to text
+    """
+    if content_type == "text/html":
+        return True
+    start = body[:64].lstrip().lower()
+    return start.startswith("<html") or start.startswith("<!doctype html")
+
+
+def html_to_text(html: str, max_size: int = html_max_size) -> Tuple[str, List[str]]:
+    """Extract text and link targets from HTML; input beyond max_size
+    chars is ignored
+    :param html: HTML body
+    :param max_size: maximum number of chars to parse (None: unbounded)
+    :return: text and link targets
+    """
+    if max_size is not None:
+        html = html[:max_size]
+    parser = HtmlText()
+    for pos in range(0, len(html), CHUNK_SIZE):
+        parser.feed(html[pos:pos + CHUNK_SIZE])
+    parser.close()
+    return "".join(parser.text), parser.links
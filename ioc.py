@@ -0,0 +1,100 @@
+# Copyright 2022 Jakob Schaffarczyk
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Single pass extraction of IOCs (coin addresses, IBANs, URLs, IPs, mails)
+from normalized (lower case) mail content
+"""
+import re
+from typing import Dict, List, Tuple
+
+# Order matters: at the same position the first alternative wins
+# (e.g. an URL containing an IP or a mail address is one URL)
+PATTERNS = [
+    ("url", r'(?:https?|ftp)://[^\s<>"\']+|www\.[^\s<>"\']+'),
+    ("email", r'[a-z0-9._%+-]+@(?:[a-z0-9-]+\.)+[a-z]{2,}'),
+    ("eth", r'0x[0-9a-f]{40}'),
+    # legacy (base58) and bech32/bech32m; content is lower case
+    ("btc", r'bc1[a-z0-9]{25,87}|[13][a-z0-9]{25,39}'),
+    ("xmr", r'[48][0-9ab][1-9a-z]{93}'),
+    ("iban", r'[a-z]{2}[0-9]{2}(?: ?[a-z0-9]{4}){2,7}(?: ?[a-z0-9]{1,4})?'),
+    ("ip", r'(?:(?:25[0-5]|2[0-4][0-9]|1?[0-9]?[0-9])\.){3}(?:25[0-5]|2[0-4][0-9]|1?[0-9]?[0-9])'),
+]
+IOC_TYPES = [kind for kind, _ in PATTERNS]
+SCANNER = re.compile(
+    r'(?<![a-z0-9])(?:' + "|".join(f"(?P<{kind}>{pattern})" for kind, pattern in PATTERNS)
+    + r')(?![a-z0-9])')
+URL_TRAILER = ".,;:!?)]}'\""
+
+
+def valid_iban(iban: str) -> bool:
+    """Check IBAN checksum (ISO 13616, mod 97)
+    :param iban: IBAN, may contain spaces
+    :return: whether checksum is valid
+    """
+    iban = iban.replace(" ", "").upper()
+    digits = "".join(str(int(char, 36)) for char in iban[4:] + iban[:4])
+    return int(digits) % 97 == 1
+
+
+class Iocs:
+    """IOCs of a text with their positions
+    """
+    __slots__ = ("text", "spans")
+
+    def __init__(self, text: str):
+        """Scan text once for all IOC types
+
+        Args:
+            text (str): Normalized (lower case) mail content
+        """
+        self.text = text
+        self.spans: Dict[str, List[Tuple[int, int]]] = {kind: [] for kind in IOC_TYPES}
+        for match in SCANNER.finditer(text):
+            kind = match.lastgroup
+            start, end = match.span()
+            if kind == "url":
+                while end > start and text[end - 1] in URL_TRAILER:
+                    end -= 1
+            elif kind == "iban" and not valid_iban(match.group()):
+                continue
+            self.spans[kind].append((start, end))
+
+    def values(self, kind: str) -> List[str]:
+        """Get all IOCs of a type
+
+        Args:
+            kind (str): One of IOC_TYPES
+
+        Returns:
+            List[str]: IOCs in order of appearance
+        """
+        return [self.text[start:end] for start, end in self.spans[kind]]
+
+    def count(self, kind: str) -> int:
+        """Count IOCs of a type
+
+        Args:
+            kind (str): One of IOC_TYPES
+
+        Returns:
+            int: Number of IOCs
+        """
+        return len(self.spans[kind])
+
+    def counts(self) -> Dict[str, int]:
+        """Count IOCs of every type
+
+        Returns:
+            Dict[str, int]: Number of IOCs per type
+        """
+        return {kind: len(spans) for kind, spans in self.spans.items()}
@@ -0,0 +1,101 @@
+# Copyright 2022 Jakob Schaffarczyk
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Long-lived LanguageTool instances shared by all mails of a process
+"""
+from threading import BoundedSemaphore, Lock
+from typing import Any, Dict, Optional
+import atexit
+from settings import languagetool_server, languagetool_max_checks
+
+
+class LanguageToolPool:
+    """Pool of LanguageTool instances keyed by language code (de-DE, en-GB)
+
+    Every instance is created on first use and kept until close(); with
+    `remote_server` set all instances (and all worker processes) talk to one
+    already running LanguageTool server instead of starting their own.
+    """
+
+    def __init__(self, remote_server: Optional[str] = None, max_checks: int = 1):
+        """Init pool
+
+        Args:
+            remote_server (Optional[str], optional): URL of a running LanguageTool server. Defaults to None.
+            max_checks (int, optional): Max. concurrent checks per instance. Defaults to 1.
+        """
+        self.remote_server = remote_server
+        self.max_checks = max(1, max_checks)
+        self._tools: Dict[str, Any] = {}
+        self._limits: Dict[str, BoundedSemaphore] = {}
+        self._lock = Lock()
+
+    def get(self, code: str) -> Any:
+        """Get LanguageTool instance for language code; start it if needed
+
+        Args:
+            code (str): Language code, e.g. "de-DE"
+
+        Returns:
+            language_tool_python.LanguageTool: LanguageTool instance
+        """
+        with self._lock:
+            if code not in self._tools:
+                import language_tool_python
+                self._tools[code] = language_tool_python.LanguageTool(
+                    code, remote_server=self.remote_server)
+                self._limits[code] = BoundedSemaphore(self.max_checks)
+            return self._tools[code]
+
+    def check(self, code: str, text: str) -> list:
+        """Check text with the instance of the language code
+
+        Args:
+            code (str): Language code, e.g. "de-DE"
+            text (str): Text to check
+
+        Returns:
+            list: LanguageTool matches
+        """
+        tool = self.get(code)
+        with self._limits[code]:
+            return tool.check(text)
+
+    def close(self):
+        """Shut down all instances (and their local Java servers)
+        """
+        with self._lock:
+            for tool in self._tools.values():
+                try:
+                    tool.close()
+                except Exception:
+                    pass
+            self._tools.clear()
+            self._limits.clear()
+
+
+LANGUAGE_TOOLS = LanguageToolPool(languagetool_server, languagetool_max_checks)
+atexit.register(LANGUAGE_TOOLS.close)
+
+
+def configure(remote_server: Optional[str] = None, max_checks: Optional[int] = None):
+    """Reconfigure the shared pool; running instances are shut down
+
+    Args:
+        remote_server (Optional[str], optional): URL of a running LanguageTool server. Defaults to None.
+        max_checks (Optional[int], optional): Max. concurrent checks per instance. Defaults to None.
+    """
+    LANGUAGE_TOOLS.close()
+    LANGUAGE_TOOLS.remote_server = remote_server
+    if max_checks is not None:
+        LANGUAGE_TOOLS.max_checks = max(1, max_checks)
@@ -0,0 +1,193 @@
+# Copyright 2022 Jakob Schaffarczyk
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Streaming MIME walker; decodes only the body part and skips attachments
+"""
+from email.message import Message
+from email.parser import BytesHeaderParser
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+import base64
+import binascii
+import quopri
+
+# Max. length of one read; longer lines (e.g. binary parts) are read in pieces
+CHUNK_SIZE = 64 * 1024
+
+
+def read_header_block(fp: BinaryIO) -> bytes:
+    """Read header block of mail without touching the body
+    :param fp: mail file opened in binary mode
+    :return: raw headers including the terminating empty line
+    """
+    lines = []
+    while line := fp.readline(CHUNK_SIZE):
+        lines.append(line)
+        if line in (b"\r\n", b"\n"):
+            break
+    return b"".join(lines)
+
+
+def _lines(fp: BinaryIO) -> Iterator[Tuple[bytes, bool]]:
+    """internal: Read file in lines of at most CHUNK_SIZE bytes
+
+    Args:
+        fp (BinaryIO): Mail file opened in binary mode
+
+    Yields:
+        Iterator[Tuple[bytes, bool]]: Line (or piece) and whether it starts a new line
+    """
+    at_start = True
+    while line := fp.readline(CHUNK_SIZE):
+        yield line, at_start
+        at_start = line.endswith(b"\n")
+
+
+def _is_attachment(part: Message) -> bool:
+    """internal: Check if part is an attachment
+
+    Args:
+        part (Message): Part headers
+
+    Returns:
+        bool: Whether part is an attachment
+    """
+    return "attachment" in str(part.get("Content-Disposition", "")).lower()
+
+
+def decode_part(part: Message, raw: bytes) -> str:
+    """Decode transfer encoding and charset of a text part
+
+    Args:
+        part (Message): Part headers
+        raw (bytes): Encoded payload
+
+    Returns:
+        str: Decoded text
+    """
+    encoding = str(part.get("Content-Transfer-Encoding", "")).strip().lower()
+    if encoding == "base64":
+        try:
+            raw = base64.b64decode(b"".join(raw.split()))
+        except (binascii.Error, ValueError):
+            pass
+    elif encoding == "quoted-printable":
+        raw = quopri.decodestring(raw)
+    charset = part.get_content_charset() or "utf-8"
+    try:
+        return raw.decode(charset, errors="replace")
+    except LookupError:
+        return raw.decode("utf-8", errors="replace")
+
+
+class MimeWalker:
+    """Walk through a mail once, line by line
+
+    Only the first text/plain part (or the first text/html part if there is
+    no text/plain part) is buffered and decoded; all other parts are skipped
+    without being held in memory. Attachment metadata is recorded on request.
+    """
+
+    def __init__(self, attachments: bool = False):
+        """Init walker
+
+        Args:
+            attachments (bool, optional): Record name, type and size of every attachment;
+                otherwise reading stops as soon as a text/plain body is found. Defaults to False.
+        """
+        self.attachments = attachments
+
+    def walk(self, fp: BinaryIO) -> Dict[str, object]:
+        """Parse mail
+
+        Args:
+            fp (BinaryIO): Mail file opened in binary mode
+
+        Returns:
+            Dict[str, object]: Message (headers only), Body, BodyType and Attachments
+        """
+        msg = BytesHeaderParser().parsebytes(read_header_block(fp))
+        context = {"Message": msg, "Body": None, "BodyType": None, "Attachments": []}
+        if msg.get_content_maintype() == "multipart" and msg.get_boundary():
+            self._walk_multipart(fp, msg.get_boundary(), context)
+        elif msg.get_content_maintype() == "text":
+            context["Body"] = decode_part(msg, fp.read())
+            context["BodyType"] = msg.get_content_type()
+        return context
+
+    def _walk_multipart(self, fp: BinaryIO, boundary: str, context: Dict[str, object]):
+        """internal: Walk body of multipart mail including nested multiparts
+
+        Args:
+            fp (BinaryIO): Mail file positioned after the header block
+            boundary (str): Boundary of the outermost multipart
+            context (Dict[str, object]): Context to fill
+        """
+        boundaries: List[bytes] = [b"--" + boundary.encode("ascii", "replace")]
+        part: Optional[Message] = None
+        buffer: Optional[List[bytes]] = None
+        attachment: Optional[Dict[str, object]] = None
+        html: Optional[Tuple[Message, bytes]] = None
+
+        def close_part():
+            nonlocal part, buffer, attachment, html
+            if buffer is not None:
+                raw = b"".join(buffer)
+                # Line break before the delimiter belongs to the delimiter
+                raw = raw[:-2] if raw.endswith(b"\r\n") else raw[:-1] if raw.endswith(b"\n") else raw
+                if part.get_content_type() == "text/plain":
+                    context["Body"] = decode_part(part, raw)
+                    context["BodyType"] = "text/plain"
+                elif html is None:
+                    html = (part, raw)
+            if attachment is not None:
+                if str(part.get("Content-Transfer-Encoding", "")).strip().lower() == "base64":
+                    attachment["size"] = attachment["size"] * 3 // 4
+                context["Attachments"].append(attachment)
+            part, buffer, attachment = None, None, None
+
+        for line, at_start in _lines(fp):
+            delimiter = line.rstrip() if at_start and line.startswith(b"--") else None
+            closings = [b + b"--" for b in boundaries]
+            if delimiter is not None and (delimiter in boundaries or delimiter in closings):
+                close_part()
+                if context["BodyType"] == "text/plain" and not self.attachments:
+                    return
+                if delimiter in closings:
+                    del boundaries[closings.index(delimiter):]
+                    if not boundaries:
+                        break
+                    continue
+                part = BytesHeaderParser().parsebytes(read_header_block(fp))
+                if part.get_content_maintype() == "multipart" and part.get_boundary():
+                    boundaries.append(b"--" + part.get_boundary().encode("ascii", "replace"))
+                    part = None
+                elif (part.get_content_type() in ("text/plain", "text/html")
+                      and not _is_attachment(part)
+                      and context["BodyType"] is None
+                      and (part.get_content_type() == "text/plain" or html is None)):
+                    buffer = []
+                elif self.attachments:
+                    attachment = {
+                        "filename": part.get_filename(),
+                        "content_type": part.get_content_type(),
+                        "size": 0,
+                    }
+                continue
+            if buffer is not None:
+                buffer.append(line)
+            elif attachment is not None:
+                attachment["size"] += len(line.rstrip(b"\r\n"))
+        close_part()
+        if context["Body"] is None and html is not None:
+            context["Body"] = decode_part(*html)
+            context["BodyType"] = "text/html"
@@ -0,0 +1,158 @@
+# Copyright 2022 Jakob Schaffarczyk
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Asyncio based resolver and mail port prober for is_domain_working
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+import asyncio
+import socket
+from settings import mail_ports
+
+
+class NetChecker:
+    """Resolve domains and probe their mail ports concurrently
+
+    All probes of one check_domains(_async) call share a concurrency limit
+    (the limit is per call, not per checker); each domain has its own
+    deadline, so one slow domain can't stall the others.
+    """
+
+    def __init__(self, ports: Optional[List[int]] = None, timeout: float = 2.0,
+                 deadline: float = 5.0, limit: int = 64):
+        """Init network checker
+
+        Args:
+            ports (Optional[List[int]], optional): Ports to probe. Defaults to settings.mail_ports.
+            timeout (float, optional): Timeout per connection attempt in seconds. Defaults to 2.0.
+            deadline (float, optional): Deadline per domain in seconds. Defaults to 5.0.
+            limit (int, optional): Max. concurrent lookups/connections per call. Defaults to 64.
+        """
+        self.ports = mail_ports if ports is None else ports
+        self.timeout = timeout
+        self.deadline = deadline
+        self.limit = limit
+
+    async def resolve(self, domain: str, sem: asyncio.Semaphore) -> Optional[str]:
+        """Resolve IPv4 address of domain
+
+        Args:
+            domain (str): Domain
+            sem (asyncio.Semaphore): Concurrency limit of the call
+
+        Returns:
+            Optional[str]: IP address; None if domain does not resolve
+        """
+        loop = asyncio.get_running_loop()
+        async with sem:
+            try:
+                infos = await loop.getaddrinfo(domain, None, family=socket.AF_INET,
+                                               type=socket.SOCK_STREAM)
+            except (socket.gaierror, UnicodeError):
+                return None
+        return infos[0][4][0] if infos else None
+
+    async def is_port_open(self, ip_addr: str, port: int, sem: asyncio.Semaphore) -> bool:
+        """Check for open port
+
+        Args:
+            ip_addr (str): IP address
+            port (int): Port
+            sem (asyncio.Semaphore): Concurrency limit of the call
+
+        Returns:
+            bool: Whether port is open or not
+        """
+        async with sem:
+            try:
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection(ip_addr, port), self.timeout)
+            except (OSError, asyncio.TimeoutError):
+                return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
+
+    async def _check_domain(self, domain: str, sem: asyncio.Semaphore) -> int:
+        """internal: Resolve domain and probe ports until the first open one
+
+        Args:
+            domain (str): Domain
+            sem (asyncio.Semaphore): Concurrency limit of the call
+
+        Returns:
+            int: 1 if any mail port is open; 0 otherwise
+        """
+        ip_addr = await self.resolve(domain, sem)
+        if ip_addr is None:
+            return 0
+        probes = [asyncio.ensure_future(self.is_port_open(ip_addr, port, sem))
+                  for port in self.ports]
+        try:
+            for probe in asyncio.as_completed(probes):
+                if await probe:
+                    return 1
+        finally:
+            for probe in probes:
+                probe.cancel()
+        return 0
+
+    async def check_domain(self, domain: str, sem: asyncio.Semaphore) -> int:
+        """Check if domain is able to receive mails within the deadline
+
+        Args:
+            domain (str): Domain
+            sem (asyncio.Semaphore): Concurrency limit of the call
+
+        Returns:
+            int: 1 if any mail port is open; 0 otherwise or on deadline
+        """
+        try:
+            return await asyncio.wait_for(self._check_domain(domain, sem), self.deadline)
+        except asyncio.TimeoutError:
+            return 0
+
+    async def check_domains_async(self, domains: Iterable[str]) -> Dict[str, int]:
+        """Check many domains concurrently; use from an already running event loop
+
+        Args:
+            domains (Iterable[str]): Domains
+
+        Returns:
+            Dict[str, int]: Result per domain
+        """
+        domains = list(dict.fromkeys(domains))
+        sem = asyncio.Semaphore(self.limit)
+        results = await asyncio.gather(*[self.check_domain(domain, sem) for domain in domains])
+        return dict(zip(domains, results))
+
+    def check_domains(self, domains: Iterable[str]) -> Dict[str, int]:
+        """Check many domains concurrently; if called from a running event loop
+        (e.g. the synchronous Analyzer API inside an async service), the checks
+        run in an event loop of their own thread and the caller blocks
+
+        Args:
+            domains (Iterable[str]): Domains
+
+        Returns:
+            Dict[str, int]: Result per domain
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.check_domains_async(domains))
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.check_domains_async(domains)).result()
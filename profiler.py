@@ -0,0 +1,225 @@
+# Copyright 2022 Jakob Schaffarczyk
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Timing and profiling instrumentation for the checks
+"""
+from typing import Any, Callable, Dict, List, Optional
+import heapq
+import json
+import marshal
+import os
+import random
+import time
+from Report.result import Result
+
+
+def timed_call(timings: List[dict], name: str, func: Callable, *args) -> Any:
+    """Call check and record wall time, CPU time and exception
+
+    Args:
+        timings (List[dict]): Timings of the current mail; record is appended
+        name (str): Name of the check
+        func (Callable): Check
+        *args: Arguments of the check
+
+    Returns:
+        Any: Return value of the check
+
+    Raises:
+        Exception: Exception of the check; recorded before it is raised again
+    """
+    record = {"check": name, "wall": 0.0, "cpu": 0.0, "error": None}
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        return func(*args)
+    except Exception as exception:
+        record["error"] = f"{type(exception).__name__}: {exception}"
+        raise
+    finally:
+        record["wall"] = time.perf_counter() - wall
+        record["cpu"] = time.process_time() - cpu
+        timings.append(record)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile
+
+    Args:
+        values (List[float]): Sorted values
+        pct (float): Percentile (0-100)
+
+    Returns:
+        float: Percentile; 0.0 for no values
+    """
+    if not values:
+        return 0.0
+    rank = max(0, min(len(values) - 1, round(pct / 100 * len(values) + .5) - 1))
+    return values[rank]
+
+
+class CheckStats:
+    """Aggregates of one check with bounded memory: exact count, errors,
+    total and maxima; percentiles come from a fixed-size uniform sample
+    of the (wall, CPU) times (reservoir sampling, Algorithm R)
+    """
+    __slots__ = ("count", "errors", "total", "max", "cpu_max", "wall", "cpu", "_size", "_rng")
+
+    def __init__(self, size: int, rng: random.Random):
+        """Init empty aggregates
+
+        Args:
+            size (int): Number of sampled timings
+            rng (random.Random): Random generator for the sample
+        """
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.cpu_max = 0.0
+        self.wall: List[float] = []
+        self.cpu: List[float] = []
+        self._size = max(1, size)
+        self._rng = rng
+
+    def add(self, record: dict):
+        """Add timing record of one call
+
+        Args:
+            record (dict): Record as written by timed_call
+        """
+        wall, cpu = record["wall"], record["cpu"]
+        self.count += 1
+        self.total += wall
+        self.max = max(self.max, wall)
+        self.cpu_max = max(self.cpu_max, cpu)
+        if record["error"]:
+            self.errors += 1
+        if len(self.wall) < self._size:
+            self.wall.append(wall)
+            self.cpu.append(cpu)
+        else:
+            idx = self._rng.randrange(self.count)
+            if idx < self._size:
+                self.wall[idx] = wall
+                self.cpu[idx] = cpu
+
+
+class RunStats:
+    """Collect timings of all mails of one run; memory use does not grow
+    with the number of mails (see CheckStats)
+    """
+
+    def __init__(self, trace_file: Optional[str] = None, profile_top: int = 0,
+                 sample_size: int = 4096):
+        """Init run statistics
+
+        Args:
+            trace_file (Optional[str], optional): JSON Lines file for one record per mail. Defaults to None.
+            profile_top (int, optional): Keep cProfile stats of the slowest N mails. Defaults to 0.
+            sample_size (int, optional): Timings per check kept for p50/p95. Defaults to 4096.
+        """
+        self.checks: Dict[str, CheckStats] = {}
+        self.sample_size = sample_size
+        # Fixed seed: the same run gives the same summary
+        self._rng = random.Random(0)
+        self.profile_top = profile_top
+        self._profiles: List[tuple] = []
+        self._counter = 0
+        self._trace = open(trace_file, "w", encoding="utf-8") if trace_file else None
+
+    def add(self, result: Result):
+        """Add timings (and profile) of one mail
+
+        Args:
+            result (Result): Result with timings
+        """
+        for record in result.timings:
+            stats = self.checks.get(record["check"])
+            if stats is None:
+                stats = self.checks[record["check"]] = CheckStats(self.sample_size, self._rng)
+            stats.add(record)
+        if self._trace and result.timings:
+            self._trace.write(json.dumps({"mail": result.mail, "checks": result.timings}) + "\n")
+        if self.profile_top and result.profile is not None:
+            total = sum(record["wall"] for record in result.timings)
+            self._counter += 1
+            item = (total, self._counter, result.mail, result.profile)
+            if len(self._profiles) < self.profile_top:
+                heapq.heappush(self._profiles, item)
+            else:
+                heapq.heappushpop(self._profiles, item)
+        result.profile = None
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """p50/p95/max of wall and CPU time per check; percentiles are exact
+        up to sample_size calls and estimated from the sample beyond
+
+        Returns:
+            Dict[str, Dict[str, float]]: Statistics per check in seconds
+        """
+        stats = {}
+        for check, check_stats in self.checks.items():
+            walls = sorted(check_stats.wall)
+            cpus = sorted(check_stats.cpu)
+            stats[check] = {
+                "count": check_stats.count,
+                "errors": check_stats.errors,
+                "total": check_stats.total,
+                "p50": percentile(walls, 50),
+                "p95": percentile(walls, 95),
+                "max": check_stats.max,
+                "cpu_p50": percentile(cpus, 50),
+                "cpu_p95": percentile(cpus, 95),
+                "cpu_max": check_stats.cpu_max,
+            }
+        return stats
+
+    def format_summary(self) -> str:
+        """Summary as table
+
+        Returns:
+            str: One line per check, times in milliseconds
+        """
+        lines = [f"{'check':<24}{'count':>8}{'errors':>8}{'p50':>10}{'p95':>10}"
+                 f"{'max':>10}{'cpu p95':>10}{'total s':>10}"]
+        for check, stat in sorted(self.summary().items(), key=lambda i: -i[1]["total"]):
+            lines.append(f"{check:<24}{stat['count']:>8}{stat['errors']:>8}"
+                         f"{stat['p50']*1000:>10.2f}{stat['p95']*1000:>10.2f}"
+                         f"{stat['max']*1000:>10.2f}{stat['cpu_p95']*1000:>10.2f}"
+                         f"{stat['total']:>10.2f}")
+        return "\n".join(lines)
+
+    def dump_profiles(self, directory: str) -> List[str]:
+        """Write cProfile stats of the slowest mails; open with pstats.Stats(fname)
+
+        Args:
+            directory (str): Output directory
+
+        Returns:
+            List[str]: Written files, slowest first
+        """
+        os.makedirs(directory, exist_ok=True)
+        fnames = []
+        for rank, (total, _, mail, stats) in enumerate(sorted(self._profiles, reverse=True), 1):
+            fname = os.path.join(directory, f"{rank:03d}_{os.path.basename(mail)}.prof")
+            with open(fname, "wb") as f:
+                marshal.dump(stats, f)
+            fnames.append(fname)
+        return fnames
+
+    def close(self):
+        """Close trace file
+        """
+        if self._trace:
+            self._trace.close()
+            self._trace = None
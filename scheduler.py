@@ -0,0 +1,120 @@
+# Copyright 2022 Jakob Schaffarczyk
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cost-aware check order and weighted score based on data/weights.json
+"""
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+import json
+
+# Cost classes of the checks, cheapest first
+COSTS: List[str] = ["header", "text", "nlp", "network"]
+WEIGHTS = str(Path(__file__).resolve().parent / "data" / "weights.json")
+
+
+class Scheduler:
+    """Order checks by cost and decide when the verdict can't change anymore
+
+    Every check contributes `weight * min(value, max) / max` to the score
+    (`weight * (1 - ...)` if inverted, i.e. high values are benign). A mail is
+    suspicious once the score reaches the threshold; below it the verdict is
+    "error" if a weighted check failed, as its contribution is unknown.
+    """
+
+    def __init__(self, fname: str = WEIGHTS, early_exit: bool = False):
+        """Load weights
+
+        Args:
+            fname (str, optional): Weights file. Defaults to data/weights.json next to this module.
+            early_exit (bool, optional): Skip remaining checks once the verdict is fixed. Defaults to False.
+        """
+        with open(fname, "r", encoding="utf-8") as f:
+            config = json.load(f)
+        self.threshold: float = config["threshold"]
+        self.weights: Dict[str, Dict[str, Any]] = config["checks"]
+        self.early_exit = early_exit
+
+    def order(self, checks: Dict[str, Dict[str, Any]]) -> List[str]:
+        """Order checks for one mail
+
+        Args:
+            checks (Dict[str, Dict[str, Any]]): Check registry (analyzer.CHECKS)
+
+        Returns:
+            List[str]: Check names; by cost class if early exit is enabled
+        """
+        if not self.early_exit:
+            return list(checks)
+        return sorted(checks, key=lambda check: COSTS.index(checks[check]["cost"]))
+
+    def contribution(self, check: str, value: Any) -> float:
+        """Weighted contribution of one check result
+
+        Args:
+            check (str): Name of the check
+            value (Any): Result of the check; None if skipped
+
+        Returns:
+            float: Contribution to the score
+        """
+        conf = self.weights.get(check)
+        if conf is None or not isinstance(value, (int, float)):
+            return 0
+        ratio = min(max(value, 0), conf["max"]) / conf["max"]
+        if conf.get("invert"):
+            ratio = 1 - ratio
+        return conf["weight"] * ratio
+
+    def score(self, data: Dict[str, Any]) -> float:
+        """Weighted score of all check results
+
+        Args:
+            data (Dict[str, Any]): Check results
+
+        Returns:
+            float: Score
+        """
+        return sum(self.contribution(check, value) for check, value in data.items())
+
+    def decided(self, score: float, pending: Iterable[str]) -> bool:
+        """Check if the remaining checks can still change the verdict
+
+        Args:
+            score (float): Current score
+            pending (Iterable[str]): Checks not run yet
+
+        Returns:
+            bool: Whether the verdict is fixed
+        """
+        if not self.early_exit:
+            return False
+        if score >= self.threshold:
+            return True
+        upper = score + sum(self.weights.get(check, {}).get("weight", 0) for check in pending)
+        return upper < self.threshold
+
+    def verdict(self, score: Optional[float], failed: Iterable[str] = ()) -> str:
+        """Verdict for score
+
+        Args:
+            score (Optional[float]): Score
+            failed (Iterable[str], optional): Checks that raised an exception. Defaults to ().
+
+        Returns:
+            str: suspicious|benign|error
+        """
+        if score is not None and score >= self.threshold:
+            return "suspicious"
+        if any(self.weights.get(check, {}).get("weight", 0) for check in failed):
+            return "error"
+        return "benign"
@@ -0,0 +1,166 @@
+# Copyright 2022 Jakob Schaffarczyk
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark the analyzer on a (synthetic) corpus and write machine-readable results
+
+Usage (from the repository root):
+    $ python scripts/generate_corpus.py -n 1000 -o bench/corpus
+    $ python scripts/benchmark.py bench/corpus -j 4 -o bench/HEAD.json
+    $ python scripts/benchmark.py bench/corpus -j 4 -o bench/new.json --compare bench/HEAD.json
+"""
+
+from typing import Any, Dict, List, Optional
+import argparse
+import glob
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analyzer import Analyzer  # noqa: E402
+from helper import read_eml  # noqa: E402
+from profiler import RunStats  # noqa: E402
+
+
+def git_commit() -> Optional[str]:
+    """Current git commit of the repository
+
+    Returns:
+        Optional[str]: Commit hash; None outside of git
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def bench_parse(mails: List[str], headers_only: bool) -> Dict[str, float]:
+    """Time parsing only (helper.read_eml)
+
+    Args:
+        mails (List[str]): Paths to .eml files
+        headers_only (bool): Parse only the header block
+
+    Returns:
+        Dict[str, float]: Seconds and mails per second
+    """
+    start = time.perf_counter()
+    for mail in mails:
+        read_eml(mail, headers_only=headers_only)
+    seconds = time.perf_counter() - start
+    return {"seconds": seconds, "mails_per_sec": len(mails) / seconds if seconds else 0.0}
+
+
+def bench_run(mails: List[str], jobs: int, chunksize: int, early_exit: bool,
+              headers_only: bool) -> Dict[str, Any]:
+    """Time all checks end to end
+
+    Args:
+        mails (List[str]): Paths to .eml files
+        jobs (int): Number of worker processes
+        chunksize (int): Number of mails handed to a worker at once
+        early_exit (bool): Use scheduler early exit
+        headers_only (bool): Read only the header block and run only header checks
+
+    Returns:
+        Dict[str, Any]: End to end and per check results
+    """
+    analyzer = Analyzer(jobs=jobs, chunksize=chunksize, verbose=False, early_exit=early_exit,
+                        headers_only=headers_only)
+    stats = RunStats()
+    start = time.perf_counter()
+    for result in analyzer.analyze_many(mails):
+        stats.add(result)
+    seconds = time.perf_counter() - start
+    checks = {}
+    for check, stat in stats.summary().items():
+        stat["per_sec"] = stat["count"] / stat["total"] if stat["total"] else 0.0
+        checks[check] = stat
+    return {
+        "seconds": seconds,
+        "mails_per_sec": len(mails) / seconds if seconds else 0.0,
+        "checks": checks,
+    }
+
+
+def compare(new: Dict[str, Any], old: Dict[str, Any]):
+    """Print relative change against an older benchmark
+
+    Args:
+        new (Dict[str, Any]): Current results
+        old (Dict[str, Any]): Results to compare with
+    """
+    def delta(a: float, b: float) -> str:
+        return f"{(a / b - 1) * 100:+.1f}%" if b else "n/a"
+
+    print(f"Comparing with {old.get('commit')}")
+    print(f"{'parse mails/sec':<28}{new['parse']['mails_per_sec']:>12.2f}"
+          f"{delta(new['parse']['mails_per_sec'], old['parse']['mails_per_sec']):>10}")
+    print(f"{'end to end mails/sec':<28}{new['run']['mails_per_sec']:>12.2f}"
+          f"{delta(new['run']['mails_per_sec'], old['run']['mails_per_sec']):>10}")
+    for check, stat in new["run"]["checks"].items():
+        before = old["run"]["checks"].get(check, {}).get("per_sec", 0.0)
+        print(f"{check + ' /sec':<28}{stat['per_sec']:>12.2f}{delta(stat['per_sec'], before):>10}")
+
+
+def main():
+    """Parse arguments and run benchmark
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("corpus", help="Directory with .eml files")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Number of worker processes")
+    parser.add_argument("--chunksize", type=int, default=16, help="Number of mails handed to a worker at once")
+    parser.add_argument("--early-exit", action="store_true", help="Use scheduler early exit")
+    parser.add_argument("--headers-only", action="store_true", help="Parse and check headers only")
+    parser.add_argument("-o", "--output", default="bench/results.json", help="JSON output file")
+    parser.add_argument("--compare", default=None, help="Older JSON output to compare with")
+    args = parser.parse_args()
+
+    mails = sorted(glob.glob(os.path.join(args.corpus, "*.eml")))
+    if not mails:
+        sys.exit(f"No .eml files in '{args.corpus}'")
+    results = {
+        "commit": git_commit(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "corpus": {
+            "path": args.corpus,
+            "mails": len(mails),
+            "bytes": sum(os.path.getsize(mail) for mail in mails),
+        },
+        "options": {"jobs": args.jobs, "chunksize": args.chunksize,
+                    "early_exit": args.early_exit, "headers_only": args.headers_only},
+        "parse": bench_parse(mails, args.headers_only),
+        "run": bench_run(mails, args.jobs, args.chunksize, args.early_exit, args.headers_only),
+    }
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=4)
+    print(f"parse :: {results['parse']['mails_per_sec']:.2f} mails/sec")
+    print(f"run   :: {results['run']['mails_per_sec']:.2f} mails/sec")
+    print(f"Results written to '{args.output}'")
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -44,7 +44,10 @@ colours = {
     "Spam": "orange",
     "Fraud": "red",
     "Sextortion": "red",
-    "Business": "green"
+    "Business": "green",
+    "suspicious": "red",
+    "benign": "green",
+    "error": "orange"
 }
 
 with open("Report/settings.json", 'r', encoding="utf-8") as f:
@@ -1,11 +1,11 @@
 # Copyright 2022 Jakob Schaffarczyk
-# 
+#
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at
-# 
+#
 #     http://www.apache.org/licenses/LICENSE-2.0
-# 
+#
 # Unless required by applicable law or agreed to in writing, software
 # distributed under the License is distributed on an "AS IS" BASIS,
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
@@ -14,16 +14,90 @@
 
 # Data retrieved via:
 # $ curl -sX GET "https://www.unicode.org/Public/UCD/latest/ucd/emoji/emoji-data.txt" | grep "\[" | awk '{ print $1 }'
+import os
 
-emojis = open("emojis.txt", "r").read().splitlines()
-data = []
-for el in emojis:
-    if ".." in el:
-        a, b = el.split("..")
-        a = int(f"0x{a}", 16)
-        b = int(f"0x{b}", 16)
-        for c in range(a,b+1):
-            data.append(c)
-data = sorted(list(set(data)))
-with open("emojis.py", "w") as f:
-    f.write("EMOJIS = " + str(data[10:]))
\ No newline at end of file
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEADER = '''# Copyright 2022 Jakob Schaffarczyk
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Emoji code point ranges needed for subject anomaly analysis;
+generated by scripts/emojis_to_list.py from data/emojis.txt, do not edit
+"""
+from bisect import bisect_right
+import re
+
+'''
+
+FOOTER = '''
+EMOJI_RE = re.compile("[" + "".join(
+    f"{re.escape(chr(start))}-{re.escape(chr(end))}"
+    for start, end in zip(EMOJI_STARTS, EMOJI_ENDS)) + "]")
+
+
+def is_emoji(char: str) -> bool:
+    """Check if char is an emoji (bisect over the ranges)
+
+    Args:
+        char (str): Single character
+
+    Returns:
+        bool: Whether char is an emoji
+    """
+    code = ord(char)
+    idx = bisect_right(EMOJI_STARTS, code) - 1
+    return idx >= 0 and code <= EMOJI_ENDS[idx]
+
+
+def count_emojis(text: str) -> int:
+    """Count emoji characters in text
+
+    Args:
+        text (str): Text (e.g. subject)
+
+    Returns:
+        int: Number of emoji characters
+    """
+    if text.isascii():
+        return 0
+    return len(EMOJI_RE.findall(text))
+'''
+
+# Only ranges are used and ASCII (keycap digits) is skipped
+ranges = []
+with open(os.path.join(ROOT, "data", "emojis.txt"), "r") as f:
+    for el in f.read().splitlines():
+        if ".." in el:
+            a, b = el.split("..")
+            a = int(f"0x{a}", 16)
+            b = int(f"0x{b}", 16)
+            if b < 0x80:
+                continue
+            ranges.append([max(a, 0x80), b])
+ranges.sort()
+merged = []
+for a, b in ranges:
+    if merged and a <= merged[-1][1] + 1:
+        merged[-1][1] = max(merged[-1][1], b)
+    else:
+        merged.append([a, b])
+
+with open(os.path.join(ROOT, "emojis.py"), "w") as f:
+    f.write(HEADER)
+    f.write("# Sorted, non-overlapping code point ranges (both ends inclusive)\n")
+    f.write("EMOJI_STARTS = [\n")
+    f.write("".join(f"    0x{a:X},\n" for a, _ in merged))
+    f.write("]\nEMOJI_ENDS = [\n")
+    f.write("".join(f"    0x{b:X},\n" for _, b in merged))
+    f.write("]\n")
+    f.write(FOOTER)
@@ -0,0 +1,210 @@
+# Copyright 2022 Jakob Schaffarczyk
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Generate a synthetic .eml corpus for benchmarks
+
+Usage:
+    $ python scripts/generate_corpus.py -n 1000 -o bench/corpus --seed 1 \\
+        --mix plain=40,multipart=25,html=15,base64=10,attachment=10
+"""
+
+from email.message import EmailMessage
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+import argparse
+import os
+import random
+
+KINDS = ["plain", "multipart", "html", "base64", "attachment"]
+
+SENTENCES = {
+    "en": [
+        "Please find the requested documents attached to this message.",
+        "Your account has been suspended due to unusual activity.",
+        "We kindly ask you to confirm your payment details until Friday.",
+        "The meeting has been moved to next Tuesday at 10 am.",
+        "Click the link below to verify your mailbox.",
+        "Thank you for your order, it will be shipped within two days.",
+        "I need you to handle a confidential transfer today.",
+        "Let me know if you have any questions regarding the invoice.",
+    ],
+    "de": [
+        "Anbei finden Sie die angeforderten Unterlagen.",
+        "Ihr Konto wurde wegen ungewöhnlicher Aktivitäten gesperrt.",
+        "Bitte bestätigen Sie Ihre Zahlungsdaten bis Freitag.",
+        "Das Meeting wurde auf Dienstag um 10 Uhr verschoben.",
+        "Klicken Sie auf den folgenden Link, um Ihr Postfach zu bestätigen.",
+        "Vielen Dank für Ihre Bestellung, sie wird in zwei Tagen versendet.",
+        "Ich brauche Sie heute für eine vertrauliche Überweisung.",
+        "Melden Sie sich gerne bei Fragen zur Rechnung.",
+    ],
+}
+GREETINGS = {"en": ["Hello {}", "Dear {}", "Hi {}"], "de": ["Hallo {}", "Sehr geehrte/r {}", "Moin {}"]}
+CLOSINGS = {"en": ["Best regards", "Kind regards", "Cheers"], "de": ["Viele Grüße", "Mit freundlichen Grüßen", "Gruß"]}
+SUBJECTS = {
+    "en": ["Invoice {}", "Your account", "URGENT: payment {}$", "Meeting notes", "[EXT] Re: order {}"],
+    "de": ["Rechnung {}", "Ihr Konto", "WARNUNG: Zahlung {}€", "Protokoll", "[EXT] AW: Bestellung {}"],
+}
+NAMES = ["john.doe", "jane.roe", "max.mustermann", "erika.musterfrau", "admin", "info", "a.smith"]
+DOMAINS = ["example.com", "example.org", "mail.example.net", "phish.invalid", "gmail.com", "web.de"]
+COIN_ADDRS = ["1BoatSLRHtKNngkdXEeobR76b53LETtpyT", "bc1qar0srrr7xfkvy5l643lydnw9re59gtzzwf5mdq"]
+AUTH_RESULTS = [
+    None,
+    "spf-only",
+    "mx.example.com; spf=pass smtp.mailfrom={d}; dkim=pass header.d={d}; dmarc=pass header.from={d}",
+    "mx.example.com; spf=fail smtp.mailfrom={d}; dkim=none; dmarc=fail (p=REJECT sp=REJECT) header.from={d}",
+    "mx.example.com; spf=softfail smtp.mailfrom={d}; dkim=policy header.d={d}; dmarc=none header.from={d}",
+    "mx.example.com; spf=neutral smtp.mailfrom={d}; dkim=pass (signature was verified) header.d={d}; "
+    "dmarc=pass (p=NONE sp=NONE dis=NONE) header.from={d}",
+]
+
+
+def parse_mix(mix: str) -> Dict[str, int]:
+    """Parse kind mix, e.g. plain=40,html=10
+
+    Args:
+        mix (str): Comma separated kind=weight pairs
+
+    Returns:
+        Dict[str, int]: Weight per kind
+    """
+    weights = {}
+    for item in mix.split(","):
+        kind, weight = item.split("=")
+        if kind not in KINDS:
+            raise ValueError(f"Unknown kind '{kind}'; use one of {KINDS}")
+        weights[kind] = int(weight)
+    return weights
+
+
+def make_body(rng: random.Random, lang: str, rcpt: str, sender: str, sentences: int) -> str:
+    """Build plain text body
+
+    Args:
+        rng (random.Random): Random generator
+        lang (str): de|en
+        rcpt (str): Name of recipient
+        sender (str): Name of sender
+        sentences (int): Number of sentences
+
+    Returns:
+        str: Body
+    """
+    lines = [rng.choice(GREETINGS[lang]).format(rcpt) + ",", ""]
+    text = [rng.choice(SENTENCES[lang]) for _ in range(sentences)]
+    if rng.random() < .1:
+        text.append(rng.choice(COIN_ADDRS))
+    lines.append(" ".join(text))
+    lines += ["", rng.choice(CLOSINGS[lang]), sender]
+    return "\n".join(lines) + "\n"
+
+
+def make_html(body: str) -> str:
+    """Wrap plain text body in a marketing style HTML document
+
+    Args:
+        body (str): Plain text body
+
+    Returns:
+        str: HTML
+    """
+    style = "".join(f".c{i}{{color:#{i:06x};margin:{i}px}}" for i in range(200))
+    paragraphs = "".join(f"<p>{line}</p>" for line in body.splitlines() if line)
+    return (f"<html><head><style>{style}</style><script>var t=1;</script></head>"
+            f"<body><table><tr><td>{paragraphs}</td></tr></table>"
+            f"<a href=\"http://login.example.invalid/verify\">verify</a></body></html>")
+
+
+def make_mail(rng: random.Random, kind: str, attachment_size: int) -> EmailMessage:
+    """Build one synthetic mail
+
+    Args:
+        rng (random.Random): Random generator
+        kind (str): One of KINDS
+        attachment_size (int): Size of attachments in bytes
+
+    Returns:
+        EmailMessage: Mail
+    """
+    lang = rng.choice(["de", "en"])
+    sender_local = rng.choice(NAMES)
+    sender_domain = rng.choice(DOMAINS)
+    rcpt_local = rng.choice(NAMES)
+    sender_name = sender_local.replace(".", " ").title()
+    rcpt_name = rcpt_local.replace(".", " ").title()
+
+    msg = EmailMessage()
+    msg["From"] = f"{sender_name} <{sender_local}@{sender_domain}>"
+    msg["To"] = f"{rcpt_name} <{rcpt_local}@innogy.com>"
+    msg["Subject"] = rng.choice(SUBJECTS[lang]).format(rng.randint(100, 99999))
+    date = datetime(2022, 1, 1, tzinfo=timezone(timedelta(hours=1)))
+    msg["Date"] = format_datetime(date + timedelta(minutes=rng.randint(0, 525600)))
+    msg["Message-ID"] = f"<{rng.getrandbits(64):016x}@{sender_domain}>"
+    for hop in range(rng.randint(1, 6)):
+        msg["Received"] = f"from relay{hop}.{sender_domain} by mx{hop}.innogy.com; {msg['Date']}"
+    auth = rng.choice(AUTH_RESULTS)
+    if auth == "spf-only":
+        msg["Received-SPF"] = (f"Pass (mx.innogy.com: domain of {sender_domain} designates "
+                               f"192.0.2.{rng.randint(1, 254)} as permitted sender)")
+    elif auth is not None:
+        msg["Authentication-Results"] = auth.format(d=sender_domain)
+        msg["Received-SPF"] = f"None (mx.innogy.com: {sender_domain} does not designate permitted sender hosts)"
+
+    body = make_body(rng, lang, rcpt_name, sender_name, rng.randint(2, 40))
+    if kind == "plain":
+        msg.set_content(body)
+    elif kind == "base64":
+        msg.set_content(body, cte="base64")
+    elif kind == "html":
+        msg.set_content(make_html(body), subtype="html")
+    elif kind == "multipart":
+        msg.set_content(body)
+        msg.add_alternative(make_html(body), subtype="html")
+    elif kind == "attachment":
+        msg.set_content(body)
+        msg.add_attachment(rng.randbytes(attachment_size), maintype="application",
+                           subtype="pdf", filename=f"invoice_{rng.randint(1, 9999)}.pdf")
+    return msg
+
+
+def main():
+    """Parse arguments and write corpus
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--count", type=int, default=1000, help="Number of mails")
+    parser.add_argument("-o", "--output", default="bench/corpus", help="Output directory")
+    parser.add_argument("--mix", default="plain=40,multipart=25,html=15,base64=10,attachment=10",
+                        help="Weight per kind (" + ", ".join(KINDS) + ")")
+    parser.add_argument("--attachment-size", type=int, default=2 * 1024 * 1024,
+                        help="Size of attachments in bytes")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    mix = parse_mix(args.mix)
+    kinds: List[str] = list(mix)
+    os.makedirs(args.output, exist_ok=True)
+    for i in range(args.count):
+        if i % 100 == 0:
+            print(f"[ ] Generated {i}/{args.count} mails ...", end='\r')
+        kind = rng.choices(kinds, weights=[mix[k] for k in kinds])[0]
+        msg = make_mail(rng, kind, args.attachment_size)
+        with open(os.path.join(args.output, f"{i:07d}_{kind}.eml"), "wb") as f:
+            f.write(bytes(msg))
+    print(f"[*] Generated {args.count}/{args.count} mails ...")
+
+
+if __name__ == "__main__":
+    main()
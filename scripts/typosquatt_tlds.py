@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from fuzzywuzzy import fuzz
 import json
+import os
+import sys
 
-sm = fuzz.SequenceMatcher()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from distance import levenshtein_many  # noqa: E402
 
 tlds = open("data/tlds.txt", "r").read().splitlines()
 tlds = [tld for tld in tlds if not "&" in tld]
@@ -25,11 +27,10 @@ for i, tld in enumerate(tlds):
     print(f"Progress: {i}/{length} ...", end='\r')
     threshold = int(.3*len(tld))
     res[tld] = {}
-    for squatted in tlds:
+    for squatted, dist in zip(tlds, levenshtein_many(tld, tlds, threshold)):
         if squatted == tld:
             continue
-        sm.set_seqs(tld, squatted)
-        if sm.distance() <= threshold:
+        if dist <= threshold:
             if not threshold in res[tld].keys():
                 res[tld][threshold] = [squatted]
             else:
@@ -13,30 +13,31 @@
 # limitations under the License.
 """Settings and data store for mail analysis
 """
-import json
 import re
-with open("data/denylist.txt", "r", encoding="utf-8") as f:
-    mail_denylist = list(f.read().splitlines())
-with open("data/allowlist.txt", "r", encoding="utf-8") as f:
-    mail_allowlist = list(f.read().splitlines())
-with open("data/spam.txt", "r", encoding="utf-8") as f:
-    buzzwords_spam = list(f.read().splitlines())
-with open("data/evil.txt", "r", encoding="utf-8") as f:
-    buzzwords_evil = list(f.read().splitlines())
-with open("data/blocked_subject.txt", "r", encoding="utf-8") as f:
-    subject_blocklist = list(f.read().splitlines())
-with open("data/mail_providers.txt", "r", encoding="utf-8") as f:
-    mail_providers = f.read().splitlines()
-with open("data/most_abused_tlds.txt", "r", encoding="utf-8") as f:
-    abused_tlds = f.read().splitlines()
-with open("data/typosquatted.json", "r", encoding="utf-8") as f:
-    typosq = json.load(f)
+from datastore import load as load_data
+
+# Lists from data/ as compiled lookup structures (see datastore.py):
+# domain lists match subdomains, subject_blocklist is case folded
+_data = load_data()
+mail_denylist = _data["mail_denylist"]
+mail_allowlist = _data["mail_allowlist"]
+buzzwords_spam = _data["buzzwords_spam"]
+buzzwords_evil = _data["buzzwords_evil"]
+subject_blocklist = _data["subject_blocklist"]
+mail_providers = _data["mail_providers"]
+abused_tlds = _data["abused_tlds"]
+typosq = _data["typosq"]
 mail_ports = [110, 143, 993, 995]
 money = re.compile(r'.*[\$€\d][\d\.\,]*[\$€]?.*')
 languages = {
     "de": ["de-DE", "german"],
     "en": ["en-GB", "english"]
 }
+# URL of a running LanguageTool server; None starts one local server per language
+languagetool_server = None
+languagetool_max_checks = 1
+# HTML bodies are cut after this many chars before extracting text
+html_max_size = 512 * 1024
 
 override_dict = {
     'SPF_override_none': 'spf-none',
@@ -0,0 +1,293 @@
+# Copyright 2022 Jakob Schaffarczyk
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Mail sources for the batch runner: .eml files, folders, mbox files and Maildirs
+"""
+from typing import BinaryIO, Iterator, Optional, Union
+import glob
+import mmap
+import os
+
+
+class MailRef:
+    """Reference to one mail inside a file (e.g. an mbox) with a stable ID
+    """
+    __slots__ = ("name", "path", "offset", "length")
+
+    def __init__(self, name: str, path: str, offset: int = 0, length: Optional[int] = None):
+        """Init mail reference
+
+        Args:
+            name (str): Stable ID of the mail used in the report
+            path (str): File containing the mail
+            offset (int, optional): Start of the mail in the file. Defaults to 0.
+            length (Optional[int], optional): Length of the mail; None up to the end of the file. Defaults to None.
+        """
+        self.name = name
+        self.path = path
+        self.offset = offset
+        self.length = length
+
+    def open(self) -> BinaryIO:
+        """Open mail for reading
+
+        Returns:
+            BinaryIO: File object limited to the mail
+        """
+        fp = open(self.path, "rb")
+        if self.offset == 0 and self.length is None:
+            return fp
+        return RangeReader(fp, self.offset, self.length)
+
+    def __repr__(self) -> str:
+        """Return object as string
+
+        Returns:
+            str: Object as string
+        """
+        return f"MailRef({self.name!r})"
+
+
+# A mail is either the path of an .eml file or a reference into a bigger file
+Mail = Union[str, MailRef]
+
+
+class RangeReader:
+    """Read-only file object limited to a byte range of another file
+    """
+
+    def __init__(self, fp: BinaryIO, offset: int, length: Optional[int]):
+        """Init reader
+
+        Args:
+            fp (BinaryIO): File opened in binary mode; closed with the reader
+            offset (int): Start of the range
+            length (Optional[int]): Length of the range; None up to the end of the file
+        """
+        self._fp = fp
+        self._fp.seek(offset)
+        self._left = length if length is not None else -1
+
+    def _limit(self, size: int) -> int:
+        """internal: Limit read size to the rest of the range
+
+        Args:
+            size (int): Requested size; negative for everything
+
+        Returns:
+            int: Size to read
+        """
+        if self._left < 0:
+            return size
+        return self._left if size < 0 else min(size, self._left)
+
+    def _consume(self, data: bytes) -> bytes:
+        """internal: Account for read bytes
+
+        Args:
+            data (bytes): Read bytes
+
+        Returns:
+            bytes: Read bytes
+        """
+        if self._left >= 0:
+            self._left -= len(data)
+        return data
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes of the range
+
+        Args:
+            size (int, optional): Number of bytes; negative for the rest of the range. Defaults to -1.
+
+        Returns:
+            bytes: Read bytes; empty at the end of the range
+        """
+        if self._left == 0:
+            return b""
+        return self._consume(self._fp.read(self._limit(size)))
+
+    def readline(self, size: int = -1) -> bytes:
+        """Read one line of the range
+
+        Args:
+            size (int, optional): Maximum number of bytes; negative for no limit. Defaults to -1.
+
+        Returns:
+            bytes: Line including its line break; empty at the end of the range
+        """
+        if self._left == 0:
+            return b""
+        return self._consume(self._fp.readline(self._limit(size)))
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate over the lines of the range
+
+        Yields:
+            Iterator[bytes]: Lines including their line breaks
+        """
+        while line := self.readline():
+            yield line
+
+    def close(self):
+        """Close underlying file
+        """
+        self._fp.close()
+
+    def __enter__(self) -> "RangeReader":
+        """Enter context
+
+        Returns:
+            RangeReader: This reader
+        """
+        return self
+
+    def __exit__(self, *_):
+        """Exit context and close underlying file
+
+        Args:
+            *_: Exception type, value and traceback (ignored)
+        """
+        self.close()
+
+
+def open_mail(mail: Mail) -> BinaryIO:
+    """Open mail for reading
+
+    Args:
+        mail (Mail): Path of .eml file or MailRef
+
+    Returns:
+        BinaryIO: File object of the mail
+    """
+    if isinstance(mail, MailRef):
+        return mail.open()
+    return open(mail, "rb")
+
+
+def mail_name(mail: Mail) -> str:
+    """Name of the mail used in the report
+
+    Args:
+        mail (Mail): Path of .eml file or MailRef
+
+    Returns:
+        str: Path or stable ID
+    """
+    return mail.name if isinstance(mail, MailRef) else mail
+
+
+def iter_mbox(path: str) -> Iterator[MailRef]:
+    """Split mbox file on "From " lines without reading it into memory
+
+    The ID of every mail is "<mbox>:<offset>", which stays stable as long
+    as the mbox is only appended to.
+
+    Args:
+        path (str): mbox file
+
+    Yields:
+        Iterator[MailRef]: One reference per mail (without the "From " line)
+    """
+    if os.path.getsize(path) == 0:
+        return
+    with open(path, "rb") as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0 if mm[:5] == b"From " else mm.find(b"\nFrom ") + 1
+        if start == 0 and mm[:5] != b"From ":
+            return
+        while True:
+            end = mm.find(b"\nFrom ", start)
+            stop = len(mm) if end < 0 else end + 1
+            # Empty line before the next "From " line separates the mails
+            if mm[stop - 2:stop] == b"\n\n":
+                stop -= 1
+            # Skip the "From " line itself; it is not part of the mail
+            body = mm.find(b"\n", start) + 1
+            if 0 < body <= stop:
+                yield MailRef(f"{path}:{start}", path, body, stop - body)
+            if end < 0:
+                break
+            start = end + 1
+
+
+def iter_maildir(path: str) -> Iterator[MailRef]:
+    """List mails of a Maildir (including Maildir++ sub folders)
+
+    The ID of every mail is its unique Maildir name (without flags), which
+    stays stable when the mail moves from new/ to cur/.
+
+    Args:
+        path (str): Maildir
+
+    Yields:
+        Iterator[MailRef]: One reference per mail
+    """
+    for root, dirs, _ in os.walk(path):
+        dirs.sort()
+        for sub in ["new", "cur"]:
+            if sub not in dirs:
+                continue
+            folder = os.path.relpath(root, path)
+            for fname in sorted(os.listdir(os.path.join(root, sub))):
+                if fname.startswith("."):
+                    continue
+                key = fname.split(":")[0]
+                name = key if folder == "." else f"{folder}/{key}"
+                yield MailRef(name, os.path.join(root, sub, fname))
+        # cur/new/tmp contain mails, not sub folders
+        dirs[:] = [d for d in dirs if d not in ("cur", "new", "tmp")]
+
+
+def is_maildir(path: str) -> bool:
+    """Check if path is a Maildir
+
+    Args:
+        path (str): Path
+
+    Returns:
+        bool: Whether path contains cur/ and new/
+    """
+    return os.path.isdir(os.path.join(path, "cur")) and os.path.isdir(os.path.join(path, "new"))
+
+
+def is_mbox(path: str) -> bool:
+    """Check if path is an mbox file
+
+    Args:
+        path (str): Path
+
+    Returns:
+        bool: Whether file starts with a "From " line
+    """
+    with open(path, "rb") as fp:
+        return fp.read(5) == b"From "
+
+
+def iter_source(path: str) -> Iterator[Mail]:
+    """List mails of any supported source
+
+    Args:
+        path (str): .eml file, folder with .eml files, mbox file or Maildir
+
+    Yields:
+        Iterator[Mail]: Paths of .eml files or MailRefs
+    """
+    if os.path.isdir(path):
+        if is_maildir(path):
+            yield from iter_maildir(path)
+        else:
+            yield from sorted(glob.glob(os.path.join(path, "*.eml")))
+    elif is_mbox(path):
+        yield from iter_mbox(path)
+    else:
+        yield path